@@ -0,0 +1,228 @@
+"""
+Builds synthetic packs of several sizes and measures build wall time, peak memory and output size.
+
+Every pack is built in a fresh interpreter, the same way a real pack script runs. Results are written as json
+tagged with the current commit, and can be compared against an earlier run to catch regressions:
+
+    python benchmarks/bench_build.py --output before.json
+    python benchmarks/bench_build.py --compare before.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+from os.path import dirname, join, abspath
+
+REPO = dirname(dirname(abspath(__file__)))
+
+# Runs before each generated pack script. The timer starts here, and the atexit hook registered first runs last,
+# after scute has finished writing the pack
+_HEADER = """
+import atexit, json, sys, time
+_start = time.perf_counter()
+
+def _report():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        peak = peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:
+        peak = None
+    with open("result.json", "w") as f:
+        json.dump({"seconds": time.perf_counter() - _start, "peak_memory": peak}, f)
+
+atexit.register(_report)
+
+from scute import pack
+from scute.function import func
+from scute.commands import give, setblock, execute, schedule
+from scute.items import Item, nbt
+from scute.blocks import Block
+from scute.data_types import Byte, Short, Float
+from scute.tags import ItemTag, BlockTag, tick
+from scute.recipes import RecipeType
+
+pack.set_name("bench")
+pack.set_build_path("./out")
+pack.set_main_namespace("bench")
+pack.check_valid()
+"""
+
+_FUNCTIONS = """
+for i in range({n}):
+    def body():
+        give("@a", Item.diamond)
+        setblock("~", "~1", "~", Block.stone)
+        execute().as_("@a").at("@s").run(give("@s", Item.apple))
+    func("bench", f"f{{i}}")(body)
+"""
+
+_EXECUTE_CHAINS = """
+for i in range({n}):
+    def body():
+        chain = execute()
+        for depth in range(25):
+            chain = chain.as_(f"@e[tag=t{{depth}}]").at("@s").positioned("~", "~1", "~")
+        chain.if_.entity("@s[tag=target]").run(
+            [give("@s", Item.diamond), setblock("~", "~", "~", Block.gold_block)]
+        )
+    func("bench", f"chain{{i}}")(body)
+"""
+
+_RECIPES_AND_TAGS = """
+for i in range({n}):
+    RecipeType.crafting_shapeless([Item.dirt, Item.stone], Item.diamond, count=i % 64 + 1).register("bench", f"r{{i}}")
+    ItemTag("bench", f"items{{i}}", [Item.diamond, Item.dirt, Item.stone, Item.apple])
+    BlockTag("bench", f"blocks{{i}}", [Block.stone, Block.dirt])
+"""
+
+_NBT_ITEMS = """
+lore = ['"line %d"' % line for line in range(20)]
+def body():
+    for i in range({n}):
+        give("@a", Item(Item.shulker_box, nbt(BlockEntityTag=nbt(Items=[
+            nbt(Slot=Byte(slot), id="minecraft:diamond_sword", Count=Byte(1), tag=nbt(
+                Damage=Short(slot), display=nbt(Lore=lore),
+                Enchantments=[nbt(id="minecraft:sharpness", lvl=Short(5))],
+                AttributeModifiers=[nbt(Amount=Float(1.5), Slot="mainhand")],
+            ))
+            for slot in range(27)
+        ]))))
+func("bench", "nbt_items")(body)
+"""
+
+# name: (template, size, included by default)
+SCENARIOS = {
+    "functions_1k": (_FUNCTIONS, 1_000, True),
+    "functions_10k": (_FUNCTIONS, 10_000, True),
+    "functions_100k": (_FUNCTIONS, 100_000, False),
+    "execute_chains_1k": (_EXECUTE_CHAINS, 1_000, True),
+    "recipes_and_tags_5k": (_RECIPES_AND_TAGS, 5_000, True),
+    "nbt_items_500": (_NBT_ITEMS, 500, True),
+}
+
+
+def run_scenario(name: str) -> dict:
+    template, size, _ = SCENARIOS[name]
+    with tempfile.TemporaryDirectory() as folder:
+        with open(join(folder, "pack_script.py"), "w") as f:
+            f.write(_HEADER + textwrap.dedent(template.format(n=size)))
+
+        env = dict(
+            os.environ, PYTHONPATH=REPO + os.pathsep + os.environ.get("PYTHONPATH", "")
+        )
+        subprocess.run(
+            [sys.executable, "pack_script.py"],
+            cwd=folder,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+        with open(join(folder, "result.json")) as f:
+            result = json.load(f)
+
+        files = 0
+        size_on_disk = 0
+        for root, _, names in os.walk(join(folder, "out")):
+            for file in names:
+                files += 1
+                size_on_disk += os.path.getsize(join(root, file))
+        result["files"] = files
+        result["output_bytes"] = size_on_disk
+    return result
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """
+    Prints the change of every metric against a baseline run
+    Returns:
+        Whether any scenario got slower or bigger by more than the threshold
+    """
+    regressed = False
+    print(f"\nCompared to {baseline.get('commit')}:")
+    for name, result in results["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            continue
+        changes = []
+        for metric in ("seconds", "peak_memory", "output_bytes"):
+            if not before.get(metric) or result.get(metric) is None:
+                continue
+            change = result[metric] / before[metric] - 1
+            flag = ""
+            if change > threshold:
+                flag = " (regression)"
+                regressed = True
+            changes.append(f"{metric} {change:+.1%}{flag}")
+        print(f"  {name:22} " + ", ".join(changes))
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--only", nargs="*", help="Only run these scenarios")
+    parser.add_argument(
+        "--full", action="store_true", help="Also run the largest scenarios"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs per scenario, the fastest is kept"
+    )
+    parser.add_argument("--output", help="Where to write the json results")
+    parser.add_argument("--compare", help="A previous json result to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change counted as a regression",
+    )
+    args = parser.parse_args()
+
+    names = args.only or [
+        name for name, (_, _, default) in SCENARIOS.items() if default or args.full
+    ]
+    results = {"commit": _commit(), "python": sys.version.split()[0], "scenarios": {}}
+
+    for name in names:
+        runs = [run_scenario(name) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["seconds"])
+        results["scenarios"][name] = best
+        memory = (
+            f"{best['peak_memory'] / 2 ** 20:8.1f}MB"
+            if best["peak_memory"]
+            else "       ?"
+        )
+        print(
+            f"{name:22} {best['seconds']:8.3f}s {memory} {best['output_bytes'] / 1024:10.1f}KB in {best['files']} files"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
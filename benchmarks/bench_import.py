@@ -0,0 +1,61 @@
+"""
+Measures how long importing scute takes, in fresh interpreters.
+
+    python benchmarks/bench_import.py --repeat 20
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from os.path import dirname, abspath
+
+REPO = dirname(dirname(abspath(__file__)))
+
+STATEMENTS = {
+    "python": "pass",
+    "import scute": "import scute",
+    "items": "from scute.items import Item; Item.diamond",
+    "commands *": "from scute.commands import *",
+    "example imports": "from scute.commands import *; from scute.function import func; "
+    "from scute.tags import ItemTag, tick; from scute.json_text import JSONText; "
+    "from scute.recipes import RecipeType; from scute.scoreboards import Scoreboard",
+}
+
+# Timed inside the child, so interpreter startup isn't counted
+_TIMER = "import time; _start = time.perf_counter()\n{statement}\nprint(time.perf_counter() - _start)"
+
+
+def time_import(statement: str, repeat: int) -> list[float]:
+    env = dict(
+        os.environ, PYTHONPATH=REPO + os.pathsep + os.environ.get("PYTHONPATH", "")
+    )
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(statement=statement)],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        times.append(float(result.stdout.split()[-1]))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Fresh interpreters per statement"
+    )
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        times = time_import(statement, args.repeat)
+        print(
+            f"{name:16} median {statistics.median(times) * 1000:7.2f}ms  min {min(times) * 1000:7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
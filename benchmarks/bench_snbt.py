@@ -0,0 +1,146 @@
+"""
+Compares the SNBT encoder against the JSONEncoder based one it replaced, on a few large nbt payloads.
+
+    python benchmarks/bench_snbt.py
+"""
+import argparse
+import json
+import sys
+import timeit
+from os.path import dirname, abspath
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from scute.data_types import Byte, Short, Float, IntArray, _NumberType
+from scute.internal.dict_to_NBT import dict_to_NBT, to_snbt
+
+
+# The previous implementation, kept here as the baseline
+def _legacy_encode_value(value):
+    out = ""
+    if issubclass(type(value), _NumberType):
+        out += value.getNbt()
+    elif isinstance(value, dict) or isinstance(value, list):
+        out += _legacy_encode_dict_or_list(value)
+    elif isinstance(value, str):
+        escapedValue = value.replace("'", "\\'")
+        out += f"'{escapedValue}'"
+    elif isinstance(value, int) or isinstance(value, float):
+        out += str(value)
+    return out
+
+
+def _legacy_encode_dict_or_list(obj):
+    out = ""
+    index = 0
+    if isinstance(obj, dict):
+        out = "{"
+        for key, value in obj.items():
+            if index != 0:
+                out += ", "
+            out += str(key) + ": "
+            out += _legacy_encode_value(value)
+            index += 1
+        out += "}"
+    elif isinstance(obj, list):
+        out += "["
+        for value in obj:
+            if index != 0:
+                out += ", "
+            out += _legacy_encode_value(value)
+        out += "]"
+    return out
+
+
+class _LegacyEncoder(json.JSONEncoder):
+    def encode(self, obj):
+        return _legacy_encode_dict_or_list(obj)
+
+
+def legacy_dict_to_NBT(dic):
+    return json.dumps(dic, cls=_LegacyEncoder)
+
+
+def _shulker_box():
+    return {
+        "BlockEntityTag": {
+            "Items": [
+                {
+                    "Slot": Byte(slot),
+                    "id": "minecraft:diamond_sword",
+                    "Count": Byte(1),
+                    "tag": {
+                        "Damage": Short(slot),
+                        "display": {"Lore": ['"line %d"' % line for line in range(20)]},
+                        "Enchantments": [
+                            {"id": "minecraft:sharpness", "lvl": Short(5)}
+                        ],
+                        "AttributeModifiers": [
+                            {"Amount": Float(1.5), "Slot": "mainhand"}
+                        ],
+                    },
+                }
+                for slot in range(27)
+            ]
+        }
+    }
+
+
+def _storage(size):
+    return {
+        "entries": [
+            {"id": i, "name": f"entry {i}", "uuid": IntArray([i, i, i, i])}
+            for i in range(size)
+        ]
+    }
+
+
+def _nested(depth):
+    # Every level is copied into its parent by the old encoder, so this grows quadratically there
+    value = {}
+    for level in range(depth):
+        value = {
+            "level": level,
+            "lines": [f"line {i}" for i in range(20)],
+            "child": value,
+        }
+    return value
+
+
+PAYLOADS = {
+    "shulker_box": _shulker_box(),
+    "storage_1k": _storage(1_000),
+    "storage_20k": _storage(20_000),
+    "nested_300": _nested(300),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per payload, the fastest is kept"
+    )
+    args = parser.parse_args()
+
+    print(f"{'payload':14} {'legacy':>10} {'new':>10} {'compact':>10} {'speedup':>8}")
+    for name, payload in PAYLOADS.items():
+        legacy = min(
+            timeit.repeat(
+                lambda: legacy_dict_to_NBT(payload), number=1, repeat=args.repeat
+            )
+        )
+        new = min(
+            timeit.repeat(lambda: dict_to_NBT(payload), number=1, repeat=args.repeat)
+        )
+        compact = min(
+            timeit.repeat(
+                lambda: to_snbt(payload, compact=True), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{name:14} {legacy * 1000:8.2f}ms {new * 1000:8.2f}ms {compact * 1000:8.2f}ms {legacy / new:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
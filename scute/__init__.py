@@ -4,91 +4,413 @@ almost all elements of a datapack with pure code (eventually - at the moment it'
 .. include:: ../pdoc/documentation/index.md
 """
 
-import json
+import atexit
 import os
-import shutil
+from contextvars import ContextVar
 from os.path import join
 
-_function_namespaces = {}
+from scute.internal.output_tree import OutputTree
 
+# Submodules are only imported when they're first used, like scute.items.Item
+_submodules = {
+    "advancements",
+    "binary_nbt",
+    "biomes",
+    "blocks",
+    "commands",
+    "data_sources",
+    "data_types",
+    "dimensions",
+    "enchantments",
+    "function",
+    "heightmaps",
+    "instrumentation",
+    "items",
+    "json_text",
+    "recipes",
+    "relations",
+    "scoreboards",
+    "server",
+    "tags",
+    "utils",
+    "watch",
+}
+
+
+def __getattr__(name):
+    if name in _submodules:
+        import importlib
+
+        return importlib.import_module(f"scute.{name}")
+    raise AttributeError(f"module 'scute' has no attribute '{name}'")
+
+
+# The stages of a build, in order - see scute.internal.build
+_stages = ("collect", "optimize", "validate", "serialize", "write")
+
+
+class Pack:
+    def __init__(
+        self,
+        name: str = "",
+        path: str = "",
+        namespace: str = "scute",
+        description: str = "My first pack",
+        version: str | int = 1,
+        root: str = None,
+    ):
+        """
+        A datapack being built, and everything collected for it so far. Scripts normally just use `pack`, which is
+        the pack of the current context - a default one, unless it's in a `with Pack(...):` block. Each block builds
+        its own pack when it ends, so several packs can be built in one process, including at the same time in
+        different threads or asyncio tasks
+        Args:
+            name: The name of the pack
+            path: The folder the pack is built into
+            namespace: The namespace used for generated functions
+            description: The description of the pack
+            version: Like `Pack.set_version`
+            root: The folder relative build paths are in, defaults to the working directory (or the folder a
+                `scute build` was run from, on a build server)
+        """
+        defaults = _pack_defaults.get()
+        self.meta = {"pack": {"pack_format": 1, "description": description}}
+        self.name = name
+        self.root = root if root is not None else defaults.get("root")
+        self.set_build_path(path)
+        self.namespace = namespace
+        self.zip = False
+        self.compression_level = 6
+        self.incremental = True
+        self.deterministic_names = False
+        self.optimize = False
+        self.deduplicate = False
+        self.branch_mode = "scoreboard"
+        self.instrumented = False
+        self.minify = False
+        self.profile_path = None
+        self.set_version(version)
 
-class pack:
-    meta = {"pack": {"pack_format": 1, "description": "My first pack"}}
-    name = ""
-    path = ""
-    namespace = "scute"
-    _command_stack = []
+        self._profiler = None
+        self._command_stack = []
+        self._output = OutputTree()
+        # Build state that used to be module globals - created functions, function tags, scute_init's commands,
+        # scoreboards and periodic tick functions
+        self._function_namespaces = {}
+        # The locations in _function_namespaces, for checking if one is a function from @func
+        self._function_locations = set()
+        self._tags = {}
+        self._scute_init = {"commands": [], "scoreboard_needed": False}
+        self._scoreboard_list = []
+        self._periodic = {}
+        # Remembers what functions created, so they can be created again without running them - see scute.function
+        self._function_cache = defaults.get("function_cache")
+        self._built = False
+        # Set while building, so that functions created by the build are named by their body, and don't get new
+        # names every time the pack is built
+        self._hashed_names = False
+        self._tokens = []
+        # Functions run before and after each stage of the build, {stage: ([before, ...], [after, ...])}
+        self._hooks = {stage: ([], []) for stage in _stages}
+        # How long each stage of the last build took
+        self.build_times = {}
 
-    @staticmethod
-    def check_valid():
+    def __enter__(self) -> "Pack":
+        self._tokens.append(_current.set(self))
+        if self.name and self.path:
+            self.check_valid()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None and self.name and self.path:
+                self.build()
+        finally:
+            _current.reset(self._tokens.pop())
+
+    def build(self) -> dict[str, float]:
+        """
+        Builds the pack - the files collected so far are finished and written to the build path. This is done
+        automatically at the end of a `with Pack(...):` block, or when the script ends for `pack`, unless it's already
+        been built. A pack can be built more than once, like after adding more functions to it
+        The build goes through the stages "collect", "optimize", "validate", "serialize" and "write" (see
+        `scute.internal.build`), and each one is timed
+        Returns:
+            The seconds each stage took
+        """
+        from scute.internal.build import run_build
+        from scute.internal.utils import format_text
+
+        self._built = True
+        build = run_build(self)
+        self.build_times = build.times
+
+        if self._profiler:
+            self._profiler.report(
+                self.profile_path or join(self.path, self.name + ".profile.json"),
+                stages=build.times,
+            )
+
+        print(format_text(f"Built! ({sum(build.times.values()):.2f}s)", 42, 30))
+        return build.times
+
+    def add_build_hook(self, stage: str, hook, before: bool = False):
+        """
+        Runs a function every time a stage of the build finishes (or starts). It's given the
+        `scute.internal.build.Build`, with the pack's files as they are at that point
+        Args:
+            stage: "collect", "optimize", "validate", "serialize" or "write"
+            hook: The function
+            before: Whether to run it before the stage instead
+        """
+        if stage not in self._hooks:
+            raise ValueError(
+                f"Build stages are {', '.join(self._hooks)}, not {stage!r}"
+            )
+        self._hooks[stage][0 if before else 1].append(hook)
+
+    def check_valid(self):
         """
         Checks the validity of your pack, and creates the file structure. Must be run at the top of the file after you define pack.name, etc
         """
-        if pack.name != "":
-            if pack.path != "":
-                bp = join(os.path.expandvars(pack.path), pack.name)
-                shutil.rmtree(bp, ignore_errors=True)
-                os.makedirs(bp, exist_ok=True)
+        if self.name != "":
+            if self.path != "":
+                if self.zip:
+                    # The archive is written in one go at the end, so only the folder it goes in is needed
+                    bp = os.path.expandvars(self.path)
+                else:
+                    # Existing files are kept, so that only the ones which changed are rewritten at the end
+                    bp = join(os.path.expandvars(self.path), self.name)
                 try:
-                    with open(join(bp, "pack.mcmeta"), "w") as mcmeta:
-                        json.dump(pack.meta, mcmeta, indent=4)
+                    os.makedirs(bp, exist_ok=True)
                 except Exception as e:
                     print("Build path is not valid, or folder does not exist. Error:")
                     print(e)
                     return
 
-                os.makedirs(os.path.join(bp, "data"), exist_ok=True)
+                # Files are only collected here, and written to disk once the build is finished
+                self._output.write_json("pack.mcmeta", self.meta)
 
             else:
                 print("Please set a path to compile to with scute.pack.setBuildPath()")
         else:
             print("Please set a pack name with scute.pack.setName()")
 
-    @staticmethod
-    def set_name(name):
+    def set_name(self, name):
         """
         Sets the display name of the pack
         Args:
             name: The name
         """
-        pack.name = name
+        self.name = name
 
-    @staticmethod
-    def set_main_namespace(namespace):
+    def set_main_namespace(self, namespace):
         """
         Sets the namespace that will be used for automatically-generated or anonymous functions
         Args:
             namespace: The namespace
         """
-        pack.namespace = namespace
+        self.namespace = namespace
 
-    @staticmethod
-    def set_description(desc: str):
+    def set_description(self, desc: str):
         """
         Sets the description of your pack
         Args:
             desc: The description
         """
-        pack.meta["pack"]["description"] = desc
+        self.meta["pack"]["description"] = desc
 
-    @staticmethod
-    def set_version(version: str | int):
+    def set_version(self, version: str | int):
         """
         Sets the version that the pack supports
         Args:
             version: Can be a major release like "1.19.4" (goes back to 1.16) or a pack_format number like 11
         """
         if isinstance(version, str):
-            pack.meta["pack"]["pack_format"] = _versions[version]
+            self.meta["pack"]["pack_format"] = _versions[version]
         else:
-            pack.meta["pack"]["pack_format"] = version
+            self.meta["pack"]["pack_format"] = version
 
-    @staticmethod
-    def set_build_path(path: str):
+    def set_build_path(self, path: str):
         """
         Sets the folder which your datapack will be built into - for example, "%appdata%/.minecraft/saves/world/datapacks", or "./output"
         """
-        pack.path = os.path.expandvars(path)
+        path = os.path.expandvars(path)
+        if self.root and path:
+            path = join(self.root, path)
+        self.path = path
+
+    def set_zip_output(self, enabled: bool = True, compression_level: int = 6):
+        """
+        Builds the pack straight into a zip archive named after the pack in the build path, instead of a folder
+        Args:
+            enabled: Whether to build into a zip archive
+            compression_level: From 0 (no compression) to 9 (smallest archive), defaults to 6
+        """
+        self.zip = enabled
+        self.compression_level = compression_level
+
+    def set_incremental(self, enabled: bool):
+        """
+        Sets whether builds only rewrite the files that changed since the last build (the default), or delete
+        and rewrite the whole pack every time
+        Args:
+            enabled: Whether to build incrementally
+        """
+        self.incremental = enabled
+
+    def set_deterministic_names(self, enabled: bool = True):
+        """
+        Sets whether anonymous functions are named with a hash of their namespace and body instead of a random uuid.
+        Identical functions then get identical names, and names stay the same between builds
+        Args:
+            enabled: Whether to use deterministic names
+        """
+        self.deterministic_names = enabled
+
+    def set_optimize(self, enabled: bool = True):
+        """
+        Sets whether functions are optimized at the end of the build - for example, consecutive writes to the same
+        score are combined, and writes that are immediately overwritten are removed
+        Args:
+            enabled: Whether to optimize functions
+        """
+        self.optimize = enabled
+
+    def set_deduplicate(self, enabled: bool = True):
+        """
+        Sets whether anonymous functions with identical bodies are merged into one at the end of the build, with every
+        reference to them rewritten to point at the copy that's kept
+        Args:
+            enabled: Whether to deduplicate functions
+        """
+        self.deduplicate = enabled
+
+    def set_instrumented(self, enabled: bool = True):
+        """
+        Builds the pack with call counting - every function starts by adding 1 to its own score on the scute_calls
+        scoreboard. Run `function <namespace>:scute_calls_dump` in game to list the counts, and
+        `function <namespace>:scute_calls_reset` to reset them, or read them from a saved world with
+        `python -m scute.instrumentation <world folder>`
+        Args:
+            enabled: Whether to count function calls
+        """
+        self.instrumented = enabled
+
+    def set_minify(self, enabled: bool = True):
+        """
+        Makes the built pack smaller, and quicker for the game to load - anonymous functions get short names (base 36
+        counters, or the shortest unique start of their hash with deterministic names), and blank lines, comments and
+        json indentation are left out
+        Args:
+            enabled: Whether to minify the pack
+        """
+        self.minify = enabled
+
+    def set_branch_mode(self, mode: str):
+        """
+        Sets how `scute.commands.else_` is compiled
+        Args:
+            mode: "scoreboard" (the default) records whether the `execute if` branch ran in the $success score, and
+                checks it afterwards. "return" puts the whole if/else chain in its own function, where each branch
+                returns early once it runs, so every branch costs a single command - needs 1.20.3 or later.
+                Conditions that can run for several entities (`as`, `at`, `on`, `positioned as`, `rotated as` and
+                `facing entity`) still use the $success score, as returning would skip the other entities
+        """
+        if mode not in ("scoreboard", "return"):
+            raise ValueError(
+                f'Branch mode must be "scoreboard" or "return", not {mode!r}'
+            )
+        self.branch_mode = mode
+
+    def set_cache_dir(self, path: str | None, max_size: int = 256 * 1024 * 1024):
+        """
+        Caches what every function creates in a folder, and creates functions whose code and inputs haven't changed
+        since an earlier build from the cache, without running them. Useful when functions take a long time to run
+        Args:
+            path: The folder, or None to stop caching
+            max_size: The most bytes the cache can take up, defaults to 256MB. The least recently used functions are
+                deleted to make room
+        """
+        if path is None:
+            self._function_cache = None
+            return
+        from scute.internal.function_cache import DiskCache
+
+        self._function_cache = DiskCache(
+            os.path.expandvars(join(self.root, path) if self.root else path), max_size
+        )
+
+    def set_profiling(self, enabled: bool = True, report_path: str = None):
+        """
+        Profiles the build - the time spent, commands emitted and bytes written for every function, recipe and tag,
+        and the python module and line that produced them. A summary is printed and a json report is written at the end
+        Args:
+            enabled: Whether to profile the build
+            report_path: Where to write the json report, defaults to "<pack name>.profile.json" in the build path
+        """
+        from scute.internal.profiler import BuildProfiler
+
+        self._profiler = BuildProfiler() if enabled else None
+        self.profile_path = report_path
+
+    def _write_output(self, rendered: dict[str, str] = None):
+        from scute.internal.utils import format_text
+
+        if self.zip:
+            self._output.flush_zip(
+                join(self.path, self.name + ".zip"), self.compression_level, rendered
+            )
+        else:
+            written, removed = self._output.flush(
+                join(self.path, self.name), self.incremental, rendered
+            )
+            print(
+                format_text(
+                    f"Wrote {written} changed files, removed {removed} stale files", 32
+                )
+            )
+
+
+class _PackProxy:
+    """
+    The pack of the current context - `pack.set_name("my pack")` sets the name of whichever `Pack` is being built.
+    See `Pack` for every setting
+    """
+
+    def __getattr__(self, name):
+        return getattr(_current.get(_default_pack), name)
+
+    def __setattr__(self, name, value):
+        setattr(_current.get(_default_pack), name, value)
+
+    def __repr__(self):
+        return f"<pack proxy for {_current.get(_default_pack)!r}>"
+
+
+def current_pack() -> Pack:
+    """
+    Returns the pack being built in the current context
+    """
+    return _current.get(_default_pack)
+
+
+# Settings given to every pack created in the current context, {"root": ..., "function_cache": ...}. Build servers and
+# `scute watch` use it so that packs created by a script, like in a `with Pack(...):` block, get the build's folder and
+# function cache too
+_pack_defaults = ContextVar("scute_pack_defaults", default={})
+_default_pack = Pack()
+_current = ContextVar("scute_pack")
+pack = _PackProxy()
+
+
+def _build_default_pack():
+    # Scripts that only use `pack` are built when they finish, as they always have been, unless they built it already
+    if _default_pack.name and _default_pack.path and not _default_pack._built:
+        _default_pack.build()
+
+
+atexit.register(_build_default_pack)
 
 
 _versions = {
@@ -110,4 +432,7 @@ _versions = {
     "1.19.4": 12,
     "1.20": 15,
     "1.20.1": 15,
+    "1.20.2": 18,
+    "1.20.3": 26,
+    "1.20.4": 26,
 }
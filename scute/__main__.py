@@ -0,0 +1,85 @@
+"""
+The scute command line.
+
+    scute serve --port 8377
+    scute build pack.py --port 8377
+    scute watch pack.py
+"""
+import argparse
+import asyncio
+import sys
+
+
+def _serve(args):
+    from scute.server import BuildServer
+
+    try:
+        asyncio.run(BuildServer(args.host, args.port, args.jobs).serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def _build(args):
+    from scute.server import request_builds
+    from scute.internal.utils import format_text
+
+    results = asyncio.run(request_builds(args.scripts, args.host, args.port))
+    for result in results:
+        sys.stdout.write(result["output"])
+        if result["ok"]:
+            print(format_text(f"Built {result['script']} in {result['time']}s", 32))
+        else:
+            print(format_text(f"Failed to build {result.get('script')}", 31))
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+def _watch(args):
+    from scute.watch import watch
+
+    try:
+        watch(args.script, args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    from scute.server import DEFAULT_PORT
+
+    parser = argparse.ArgumentParser(prog="scute", description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_help = (
+        "Keep scute loaded, and build the packs sent to it. Scripts run one at a time, so builds only overlap when "
+        "writing packs that are built after their script ends"
+    )
+    serve = commands.add_parser("serve", help=serve_help, description=serve_help)
+    serve.add_argument(
+        "--jobs",
+        type=int,
+        help="How many builds are taken at once - their scripts still run one at a time",
+    )
+    serve.set_defaults(run=_serve)
+
+    build = commands.add_parser("build", help="Build packs on a running server")
+    build.add_argument("scripts", nargs="+", help="The scripts of the packs")
+    build.set_defaults(run=_build)
+
+    watch = commands.add_parser(
+        "watch", help="Rebuild a pack every time its files change"
+    )
+    watch.add_argument("script", help="The script of the pack")
+    watch.add_argument(
+        "--interval", type=float, default=0.25, help="Seconds between checks"
+    )
+    watch.set_defaults(run=_watch)
+
+    for command in (serve, build):
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=DEFAULT_PORT)
+
+    args = parser.parse_args()
+    sys.exit(args.run(args))
+
+
+if __name__ == "__main__":
+    main()
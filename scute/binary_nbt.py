@@ -0,0 +1,358 @@
+"""
+Reads and writes binary NBT files, like a world's level.dat and scoreboard.dat, or .nbt structures.
+
+Compounds are read lazily - a compound only finds where its entries are when it's first used, and each entry is only
+decoded when it's accessed, so reading one value from a large file doesn't build the rest of the tree. Values use the
+types from `scute.data_types`: Int is a python int, Double a python float, String a str, List a list and Compound a
+`Compound` (a mutable mapping, or any dict when writing).
+
+```python
+from scute import binary_nbt
+
+scores = binary_nbt.load("world/data/scoreboard.dat")["data"]["PlayerScores"]
+binary_nbt.dump({"DataVersion": 3465, "size": [1, 1, 1]}, "structure.nbt")
+```
+"""
+import gzip
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Mapping, MutableMapping
+
+from scute.data_types import (
+    Byte,
+    Short,
+    Long,
+    Float,
+    Double,
+    ByteArray,
+    IntArray,
+    LongArray,
+    _ArrayType,
+)
+
+END = 0
+BYTE = 1
+SHORT = 2
+INT = 3
+LONG = 4
+FLOAT = 5
+DOUBLE = 6
+BYTE_ARRAY = 7
+STRING = 8
+LIST = 9
+COMPOUND = 10
+INT_ARRAY = 11
+LONG_ARRAY = 12
+
+# tag: (struct, python type) for single numbers
+_NUMBERS = {
+    BYTE: (struct.Struct(">b"), Byte),
+    SHORT: (struct.Struct(">h"), Short),
+    INT: (struct.Struct(">i"), int),
+    LONG: (struct.Struct(">q"), Long),
+    FLOAT: (struct.Struct(">f"), Float),
+    DOUBLE: (struct.Struct(">d"), float),
+}
+# tag: (array typecode, python type) for typed arrays
+_ARRAYS = {
+    BYTE_ARRAY: ("b", ByteArray),
+    INT_ARRAY: ("i", IntArray),
+    LONG_ARRAY: ("q", LongArray),
+}
+_TYPES = {Byte: BYTE, Short: SHORT, Long: LONG, Float: FLOAT, Double: DOUBLE}
+_TYPES.update({cls: tag for tag, (_, cls) in _ARRAYS.items()})
+
+_USHORT = struct.Struct(">H")
+_INT = struct.Struct(">i")
+_LIST_HEADER = struct.Struct(">bi")
+_SWAP = sys.byteorder == "little"
+
+
+class Compound(MutableMapping):
+    def __init__(self, values: Mapping = None, name: str = ""):
+        """
+        A compound tag. Ones read from a file only decode their entries as they're used
+        Args:
+            values: The initial entries
+            name: The name of the tag, only used for the root of a file
+        """
+        self.name = name
+        self._data = None
+        self._offset = 0
+        self._entries = dict(values) if values else {}
+
+    @classmethod
+    def _lazy(cls, data: memoryview, offset: int, name: str = "") -> "Compound":
+        compound = cls(name=name)
+        compound._data = data
+        compound._offset = offset
+        compound._entries = None
+        return compound
+
+    def _index(self) -> dict:
+        # Finds where each entry is without decoding any of them
+        if self._entries is None:
+            data, offset = self._data, self._offset
+            entries = {}
+            while data[offset] != END:
+                tag = data[offset]
+                name, offset = _read_string(data, offset + 1)
+                end = _skip(data, offset, tag)
+                entries[name] = _Raw(tag, offset, end)
+                offset = end
+            self._entries = entries
+        return self._entries
+
+    def __getitem__(self, key):
+        entries = self._index()
+        value = entries[key]
+        if isinstance(value, _Raw):
+            value = entries[key] = _read(self._data, value.offset, value.tag)[0]
+        return value
+
+    def __setitem__(self, key, value):
+        self._index()[key] = value
+
+    def __delitem__(self, key):
+        del self._index()[key]
+
+    def __iter__(self):
+        return iter(self._index())
+
+    def __len__(self):
+        return len(self._index())
+
+    def __repr__(self):
+        return f"Compound({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        """
+        Decodes every entry, returning plain dicts and lists
+        """
+        return {key: _to_python(value) for key, value in self.items()}
+
+
+class _Raw:
+    __slots__ = ("tag", "offset", "end")
+
+    def __init__(self, tag: int, offset: int, end: int):
+        # An entry of a lazy compound that hasn't been decoded yet
+        self.tag = tag
+        self.offset = offset
+        self.end = end
+
+
+def _to_python(value):
+    if isinstance(value, Compound):
+        return value.to_dict()
+    if isinstance(value, list) and not isinstance(value, _ArrayType):
+        return [_to_python(item) for item in value]
+    return value
+
+
+def _read_string(data: memoryview, offset: int) -> tuple[str, int]:
+    length = _USHORT.unpack_from(data, offset)[0]
+    offset += 2
+    raw = bytes(data[offset : offset + length])
+    try:
+        return raw.decode("utf-8"), offset + length
+    except UnicodeDecodeError:
+        # Java's modified UTF-8 - null is two bytes, and other planes are encoded as surrogate pairs
+        text = raw.replace(b"\xc0\x80", b"\x00").decode("utf-8", "surrogatepass")
+        text = text.encode("utf-16", "surrogatepass").decode("utf-16")
+        return text, offset + length
+
+
+def _encode_string(text: str) -> bytes:
+    if text.isascii() and "\x00" not in text:
+        raw = text.encode()
+    else:
+        # Characters outside the basic plane are split into surrogate pairs, which are then encoded one by one
+        units = array("H", text.encode("utf-16-be", "surrogatepass"))
+        if _SWAP:
+            units.byteswap()
+        raw = "".join(map(chr, units)).encode("utf-8", "surrogatepass")
+        raw = raw.replace(b"\x00", b"\xc0\x80")
+    if len(raw) > 0xFFFF:
+        raise ValueError("NBT strings can't be longer than 65535 bytes")
+    return _USHORT.pack(len(raw)) + raw
+
+
+def _skip(data: memoryview, offset: int, tag: int) -> int:
+    # Returns the offset after a payload without decoding it
+    if tag in _NUMBERS:
+        return offset + _NUMBERS[tag][0].size
+    if tag == STRING:
+        return offset + 2 + _USHORT.unpack_from(data, offset)[0]
+    if tag in _ARRAYS:
+        size = array(_ARRAYS[tag][0]).itemsize
+        return offset + 4 + _INT.unpack_from(data, offset)[0] * size
+    if tag == LIST:
+        item_tag, length = _LIST_HEADER.unpack_from(data, offset)
+        offset += 5
+        if item_tag in _NUMBERS:
+            return offset + length * _NUMBERS[item_tag][0].size
+        for _ in range(length):
+            offset = _skip(data, offset, item_tag)
+        return offset
+    if tag == COMPOUND:
+        while data[offset] != END:
+            tag = data[offset]
+            offset = _skip(
+                data, offset + 3 + _USHORT.unpack_from(data, offset + 1)[0], tag
+            )
+        return offset + 1
+    raise ValueError(f"Unknown NBT tag type {tag}")
+
+
+def _read(data: memoryview, offset: int, tag: int) -> tuple:
+    # Returns the decoded payload and the offset after it
+    if tag in _NUMBERS:
+        fmt, cls = _NUMBERS[tag]
+        value = fmt.unpack_from(data, offset)[0]
+        return (value if cls in (int, float) else cls(value)), offset + fmt.size
+    if tag == STRING:
+        return _read_string(data, offset)
+    if tag in _ARRAYS:
+        typecode, cls = _ARRAYS[tag]
+        length = _INT.unpack_from(data, offset)[0]
+        values = array(typecode)
+        end = offset + 4 + length * values.itemsize
+        values.frombytes(data[offset + 4 : end])
+        if _SWAP:
+            values.byteswap()
+        return cls(values), end
+    if tag == LIST:
+        item_tag, length = _LIST_HEADER.unpack_from(data, offset)
+        offset += 5
+        if item_tag in _NUMBERS:
+            # Read in one go, rather than one number at a time
+            fmt, cls = _NUMBERS[item_tag]
+            values = struct.unpack_from(f">{length}{fmt.format[-1]}", data, offset)
+            if cls not in (int, float):
+                values = map(cls, values)
+            return list(values), offset + length * fmt.size
+        items = []
+        for _ in range(length):
+            item, offset = _read(data, offset, item_tag)
+            items.append(item)
+        return items, offset
+    if tag == COMPOUND:
+        compound = Compound._lazy(data, offset)
+        return compound, _skip(data, offset, COMPOUND)
+    raise ValueError(f"Unknown NBT tag type {tag}")
+
+
+def _tag_of(value) -> int:
+    tag = _TYPES.get(type(value))
+    if tag is not None:
+        return tag
+    if isinstance(value, bool):
+        return BYTE
+    if isinstance(value, int):
+        return INT
+    if isinstance(value, float):
+        return DOUBLE
+    if isinstance(value, str):
+        return STRING
+    if isinstance(value, Mapping):
+        return COMPOUND
+    if isinstance(value, (list, tuple)):
+        return LIST
+    raise TypeError(f"Can't write {type(value).__name__} as NBT")
+
+
+def _write(out: bytearray, value, tag: int):
+    if tag in _NUMBERS:
+        out += _NUMBERS[tag][0].pack(getattr(value, "number", value))
+    elif tag == STRING:
+        out += _encode_string(value)
+    elif tag in _ARRAYS:
+        values = array(_ARRAYS[tag][0], [getattr(v, "number", v) for v in value])
+        if _SWAP:
+            values.byteswap()
+        out += _INT.pack(len(value))
+        out += values.tobytes()
+    elif tag == LIST:
+        item_tag = _tag_of(value[0]) if value else END
+        out += _LIST_HEADER.pack(item_tag, len(value))
+        for item in value:
+            if _tag_of(item) != item_tag:
+                raise TypeError("Every item of an NBT list must be the same type")
+            _write(out, item, item_tag)
+    elif tag == COMPOUND:
+        # Entries of a lazy compound that were never decoded are copied as they are
+        entries = value._index() if isinstance(value, Compound) else value
+        for key, item in entries.items():
+            if isinstance(item, _Raw):
+                out.append(item.tag)
+                out += _encode_string(key)
+                out += value._data[item.offset : item.end]
+            else:
+                item_tag = _tag_of(item)
+                out.append(item_tag)
+                out += _encode_string(key)
+                _write(out, item, item_tag)
+        out.append(END)
+
+
+def loads(data: bytes) -> Compound:
+    """
+    Reads NBT from bytes, which can be gzip or zlib compressed, or uncompressed
+    Returns:
+        The root compound, with its name in `Compound.name`
+    """
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    elif data[:1] == b"\x78":
+        data = zlib.decompress(data)
+    view = memoryview(data)
+    if view[0] != COMPOUND:
+        raise ValueError("The root of an NBT file must be a compound")
+    name, offset = _read_string(view, 1)
+    return Compound._lazy(view, offset, name)
+
+
+def load(path: str) -> Compound:
+    """
+    Reads an NBT file, like level.dat or a .nbt structure
+    Returns:
+        The root compound, with its name in `Compound.name`
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def dumps(value: Mapping, name: str = None, compression: str = "gzip") -> bytes:
+    """
+    Encodes a compound as NBT
+    Args:
+        value: A `Compound` or dict
+        name: The name of the root tag, defaults to the compound's name or ""
+        compression: "gzip" (used by level.dat and structures), "zlib", or None
+    """
+    if name is None:
+        name = getattr(value, "name", "")
+    out = bytearray([COMPOUND])
+    out += _encode_string(name)
+    _write(out, value, COMPOUND)
+    if compression == "gzip":
+        return gzip.compress(out, mtime=0)
+    if compression == "zlib":
+        return zlib.compress(out)
+    return bytes(out)
+
+
+def dump(value: Mapping, path: str, name: str = None, compression: str = "gzip"):
+    """
+    Writes a compound to an NBT file
+    Args:
+        value: A `Compound` or dict
+        path: The file to write
+        name: The name of the root tag, defaults to the compound's name or ""
+        compression: "gzip" (used by level.dat and structures), "zlib", or None
+    """
+    with open(path, "wb") as f:
+        f.write(dumps(value, name, compression))
@@ -4,57 +4,106 @@ Submodule containing commands and command-related functions
 from functools import wraps
 
 from scute.blocks import Block
-from scute.internal.utils import create_function
+from scute.internal.command import Branch, Command
+from scute.internal.utils import (
+    create_function,
+    create_anonymous_function,
+    function_path,
+)
 from scute.items import Item
 from scute.function import func, _MacroArg
 from scute.internal.dict_to_NBT import dict_to_NBT
-from scute.tags import _scute_init
-from scute import pack, _function_namespaces
+from scute import pack
 from types import FunctionType
 from scute.data_sources import _NbtSource, EntityData, Storage, BlockData
 from scute.data_types import _NbtValue
 
-from uuid import uuid4
-
 # A single command, a function reference, or a list of commands
-functionArg = str | list | FunctionType
+functionArg = Command | str | list | FunctionType
+
+
+def _as_command(cmd: Command | str) -> Command:
+    return cmd if isinstance(cmd, Command) else Command.parse(cmd)
+
+
+def _take_from_stack(commands: list):
+    # Removes commands that were added to the stack when they were created, because they're being used inside another
+    # command instead. Searches from the end, as they were almost always just added
+    stack = pack._command_stack
+    for command in commands:
+        for i in range(len(stack) - 1, -1, -1):
+            if stack[i] is command:
+                del stack[i]
+                break
+
+
+def _flatten(commands: list) -> list:
+    # Commands like else_ return a list of commands, which ends up inside the list it was written in
+    flat = []
+    for command in commands:
+        if isinstance(command, list):
+            flat += _flatten(command)
+        else:
+            flat.append(command)
+    return flat
 
 
 def _functionArgument(
     cmd: functionArg, single_command_allowed: bool, delete: bool = True
-):
-    result = ""
+) -> Command:
+    result = None
 
-    # If the command is a string, meaning the return value from a command
-    if isinstance(cmd, str):
+    # If the command is a single command, meaning the return value from a command
+    if isinstance(cmd, (Command, str)):
         if single_command_allowed:
             if delete:
-                del pack._command_stack[-1]
-            result = cmd
+                _take_from_stack([cmd])
+            result = _as_command(cmd)
         else:
             cmd = [cmd]
 
     # Or, if it's a function reference
     elif isinstance(cmd, FunctionType):
-        if cmd not in _function_namespaces:
-            # Run the function as if it was decorated with @function, generating a file
-            func()(cmd)
+        # Functions already decorated with @func are called directly, rather than from a function of their own
+        function = getattr(cmd, "unwrapped", cmd)
+        if function not in pack._function_namespaces:
+            # Run the function as if it was decorated with @function, generating a file. Functions decorated while
+            # building an earlier pack are made again in this one, with the namespace and name they were given
+            getattr(cmd, "create", func())(function)
 
-        result = f"function {pack.namespace}:{_function_namespaces[cmd]}"
+        result = Command("function", [pack._function_namespaces[function]])
 
     # Or, if it's a list of commands
     if isinstance(cmd, list):
+        cmd = _flatten(cmd)
         # Delete the commands that were added to the stack
         if delete:
-            del pack._command_stack[-len(cmd) :]
-
-        for i in range(len(cmd)):
-            cmd[i] += "\n"
-
-        name = uuid4()
-        result = f"function {pack.namespace}:{name}"
-
-        create_function(pack.namespace, name, cmd)
+            _take_from_stack(cmd)
+
+        # Commands an if/else chain in the list took the place of are left out, as the chain runs them itself. A chain
+        # continued by several else_ calls is in the list once for each of them
+        replaced = {
+            id(command)
+            for branch in cmd
+            if isinstance(branch, Branch)
+            for command in branch.replaced
+        }
+        commands = []
+        for command in cmd:
+            if id(command) not in replaced:
+                if isinstance(command, Branch):
+                    replaced.add(id(command))
+                commands.append(_as_command(command))
+        # A single command doesn't need a function of its own, unless it's a return, which would exit the caller instead
+        if (
+            single_command_allowed
+            and len(commands) == 1
+            and commands[0].kind != "return"
+        ):
+            result = commands[0]
+        else:
+            name = create_anonymous_function(pack.namespace, commands)
+            result = Command("function", [f"{pack.namespace}:{name}"])
 
     return result
 
@@ -65,18 +114,19 @@ def _command(funct):
         is_macro: bool = any(isinstance(arg, _MacroArg) for arg in args)
         result = funct(*args)
 
-        if isinstance(result, str):
-            command = result + "\n"
+        if isinstance(result, Command):
             if is_macro:
-                command = "$" + command
-            pack._command_stack.append(command)
+                result.macro = True
+            pack._command_stack.append(result)
 
-        elif isinstance(result, execute):
-            command = result.com + "\n"
-            if is_macro:
-                command = "$" + command
-            # Overwrite command written by previous subcommand with new value
-            pack._command_stack[-1] = command
+        elif isinstance(result, list):
+            for command in result:
+                command.macro = command.macro or is_macro
+            pack._command_stack.extend(result)
+
+        # Subcommands of execute change the command that's already on the stack
+        elif isinstance(result, execute) and is_macro:
+            result.command.macro = True
 
         return result
 
@@ -92,14 +142,14 @@ def give(player, item: Item | str):
         item: The item to give the player, - an instance of the Item() class or a string id like Item.egg
     """
     if isinstance(item, _MacroArg):
-        return f"give {player} {item.arg}"
+        return Command("give", [player, item.arg])
     elif isinstance(item, str):
-        return f"give {player} {item}"
+        return Command("give", [player, item])
 
-    com = f"give {player} {item.commandFormat}"
+    com = Command("give", [player, item.commandFormat])
 
     if item.count != 1:
-        com += " " + str(item.count)
+        com.args.append(item.count)
 
     return com
 
@@ -111,7 +161,7 @@ def run_raw(command: _MacroArg | str):
     Args:
         command: A string or macro argument
     """
-    return command.arg if isinstance(command, _MacroArg) else command
+    return Command.parse(command.arg if isinstance(command, _MacroArg) else command)
 
 
 @_command
@@ -125,11 +175,11 @@ def setblock(x, y, z, block: Block | str):
         block: Block to place
     """
     if isinstance(block, _MacroArg):
-        return f"setblock {x} {y} {z} {block.arg}"
+        return Command("setblock", [x, y, z, block.arg])
     elif isinstance(block, str):
-        return f"setblock {x} {y} {z} {block}"
+        return Command("setblock", [x, y, z, block])
 
-    return f"setblock {x} {y} {z} {block.id}{{dict_to_NBT(block.nbt)}}"
+    return Command("setblock", [x, y, z, block.commandFormat])
 
 
 @_command
@@ -139,7 +189,7 @@ def function(funct: str):
     Args:
         funct: A resource location for a function, like mypack:func1
     """
-    return f"function {funct}"
+    return Command("function", [funct])
 
 
 @_command
@@ -151,13 +201,14 @@ def schedule(cmd: functionArg, time: int, units: str = "t"):
         time: The time until it's run
         units: "t", "d", or "s", ticks, days, or seconds respectively until the function runs (defaults to ticks)
     """
-    return f"schedule function {_functionArgument(cmd, False)} {time}{units}"
+    function_command = _functionArgument(cmd, False)
+    return Command("schedule", ["function", function_command.args[0], f"{time}{units}"])
 
 
 class execute:
     def __init__(self):
-        self.com = "execute"
-        pack._command_stack.append(self.com)
+        self.command = Command("execute")
+        pack._command_stack.append(self.command)
 
     @_command
     def at(self, selector):
@@ -166,7 +217,7 @@ class execute:
         Args:
             selector: Selector to set position to
         """
-        self.com += f" at {selector}"
+        self.command.args += ["at", selector]
         return self
 
     @_command
@@ -176,7 +227,7 @@ class execute:
         Args:
             selector: Selector to set context to
         """
-        self.com += f" as {selector}"
+        self.command.args += ["as", selector]
         return self
 
     @_command
@@ -186,7 +237,7 @@ class execute:
         Args:
             pos: "eyes" or "feet" - the anchor to set to.
         """
-        self.com += f" anchored {pos}"
+        self.command.args += ["anchored", pos]
         return self
 
     @_command
@@ -196,7 +247,7 @@ class execute:
         Args:
             axes: A swizzle of "xyz" - like "x" or "yz"
         """
-        self.com += f" align {axes}"
+        self.command.args += ["align", axes]
         return self
 
     @_command
@@ -208,7 +259,7 @@ class execute:
             y: Y coord of position to look towards
             z: Z coord of position to look towards
         """
-        self.com += f" facing {x} {y} {z}"
+        self.command.args += ["facing", x, y, z]
         return self
 
     @_command
@@ -219,7 +270,7 @@ class execute:
             selector: The entity to look towards
             anchor: "feet" or "eyes" - the point to look towards
         """
-        self.com += f" facing entity {selector} {anchor}"
+        self.command.args += ["facing", "entity", selector, anchor]
         return self
 
     @_command
@@ -229,7 +280,7 @@ class execute:
         Args:
             dimension: The resource location of a dimension, like `scute.dimensions.Dimension.overworld`
         """
-        self.com += f" in {dimension}"
+        self.command.args += ["in", dimension]
         return self
 
     @_command
@@ -239,7 +290,7 @@ class execute:
         Args:
             relation: A relation like `scute.relations.Relation.passengers`
         """
-        self.com += f" on {relation}"
+        self.command.args += ["on", relation]
         return self
 
     @_command
@@ -251,7 +302,7 @@ class execute:
             y: The y coordinate to set the position to
             z: The z coordinate to set the position to
         """
-        self.com += f" positioned {x} {y} {z}"
+        self.command.args += ["positioned", x, y, z]
         return self
 
     @_command
@@ -261,7 +312,7 @@ class execute:
         Args:
             selector: The entity to set the position to
         """
-        self.com += f" positioned as {selector}"
+        self.command.args += ["positioned", "as", selector]
         return self
 
     @_command
@@ -271,7 +322,7 @@ class execute:
         Args:
             heightmap: The heightmap to use, like `scute.heightmaps.Heightmap.world_surface`
         """
-        self.com += f" positioned over {heightmap}"
+        self.command.args += ["positioned", "over", heightmap]
         return self
 
     @_command
@@ -282,7 +333,7 @@ class execute:
             yaw: The angle around the y-axis - 0 is south, ±180 is north.
             pitch: The up-and-down angle - 0 is straight ahead
         """
-        self.com += f" rotated {yaw} {pitch}"
+        self.command.args += ["rotated", yaw, pitch]
         return self
 
     @_command
@@ -292,7 +343,7 @@ class execute:
         Args:
             selector: The entity to rotate as
         """
-        self.com += f" rotated as {selector}"
+        self.command.args += ["rotated", "as", selector]
         return self
 
     @_command
@@ -300,21 +351,28 @@ class execute:
         """
         Runs a command or function with the current execution context
         Args:
-            cmd: The command to run - can be a single command like give(), a list of commands, or a (non-wrapped!) function to run.
+            cmd: The command to run - can be a single command like give(), a list of commands, or a function to run.
         """
-        self.com += " run " + _functionArgument(cmd, True)
-        del pack._command_stack[-1]
-        return self.com
+        run = _functionArgument(cmd, True)
+        self.command.macro = self.command.macro or run.macro
+        if run.kind == "execute":
+            # `execute A run execute B run C` does the same as `execute A B run C`, which is only evaluated once
+            self.command.args += run.args
+        else:
+            self.command.args += ["run", run]
+        # Taken off the stack so that it's put back as the result, after any commands it replaced
+        _take_from_stack([self.command])
+        return self.command
 
     class _if_clause:
         def __init__(self, ex):
             self.ex = ex
-            ex.com += " if"
+            ex.command.args.append("if")
 
         class _if_data:
             def __init__(self, ex):
                 self.ex = ex
-                ex.com += " data"
+                ex.command.args.append("data")
 
             @_command
             def block(self, x, y, z, path):
@@ -326,7 +384,7 @@ class execute:
                     z: The z position of the block to test
                     path: The nbt path, like `Items[{id:"minecraft:diamond"}]`
                 """
-                self.ex.com += f" block {x} {y} {z} {path}"
+                self.ex.command.args += ["block", x, y, z, path]
                 return self.ex
 
             @_command
@@ -337,7 +395,7 @@ class execute:
                     selector: The entity to test
                     path: The nbt path, like `Invulnerable`
                 """
-                self.ex.com += f" entity {selector} {path}"
+                self.ex.command.args += ["entity", selector, path]
                 return self.ex
 
             @_command
@@ -348,7 +406,7 @@ class execute:
                     storage: The resource location of the storage for data testing, like `namespace:storage`
                     path: The nbt path, like `myTag`
                 """
-                self.ex.com += f" storage {storage} {path}"
+                self.ex.command.args += ["storage", storage, path]
                 return self.ex
 
         @property
@@ -365,7 +423,7 @@ class execute:
                 z: The z coord of the block
                 biome: The biome to check for, like Biome.beach
             """
-            self.ex.com += f" biome {x} {y} {z} {biome}"
+            self.ex.command.args += ["biome", x, y, z, biome]
             return self.ex
 
         @_command
@@ -378,7 +436,13 @@ class execute:
                 z: The z position of the block
                 block: The block, like `scute.blocks.Block.dirt`
             """
-            self.ex.com += f" block {x} {y} {z} {block.id + dict_to_NBT(block.nbt) if isinstance(block, Block) else block}"
+            self.ex.command.args += [
+                "block",
+                x,
+                y,
+                z,
+                block.commandFormat if isinstance(block, Block) else block,
+            ]
             return self.ex
 
         @_command
@@ -410,9 +474,19 @@ class execute:
                 scanmode: Whether air blocks should also be compared - "all" if yes, "masked" if no
             :return:
             """
-            self.ex.com += (
-                f" blocks {x1} {y1} {z1} {x2} {y2} {z2} {x3} {y3} {z3} {scanmode}"
-            )
+            self.ex.command.args += [
+                "blocks",
+                x1,
+                y1,
+                z1,
+                x2,
+                y2,
+                z2,
+                x3,
+                y3,
+                z3,
+                scanmode,
+            ]
             return self.ex
 
         @_command
@@ -422,7 +496,7 @@ class execute:
             Args:
                 dimension: The dimension to check for, like Dimension.overworld
             """
-            self.ex.com += f" dimension {dimension}"
+            self.ex.command.args += ["dimension", dimension]
             return self.ex
 
         @_command
@@ -432,7 +506,7 @@ class execute:
             Args:
                 selector: A selector
             """
-            self.ex.com += f" entity {selector}"
+            self.ex.command.args += ["entity", selector]
             return self.ex
 
         @_command
@@ -444,7 +518,7 @@ class execute:
                 y: The y-coord of a block in the chunk
                 z: The z-coord of a block in the chunk
             """
-            self.ex.com += f" loaded {x} {y} {z}"
+            self.ex.command.args += ["loaded", x, y, z]
             return self.ex
 
         @_command
@@ -454,13 +528,13 @@ class execute:
             Args:
                  predicate: A resource location of a predicate, like namespace:my_pred
             """
-            self.ex.com += f" predicate {predicate}"
+            self.ex.command.args += ["predicate", predicate]
             return self.ex
 
     class _unless_clause(_if_clause):
         def __init__(self, ex):
             self.ex = ex
-            ex.com += " unless"
+            ex.command.args.append("unless")
 
     @property
     def if_(self):
@@ -478,44 +552,143 @@ def else_(cmd: functionArg):
     Args:
         cmd: The function, command, or list of commands to run
     """
-    _scute_init["scoreboard_needed"] = True
-    if isinstance(cmd, str):
-        del pack._command_stack[-1]
+    # The commands passed in were added to the stack when they were created
+    _take_from_stack(_flatten(cmd) if isinstance(cmd, list) else [cmd])
+
+    else_command = _functionArgument(cmd, True, False)
 
-    p = pack._command_stack[-1]
-    if "execute" not in p or "run" not in p or "if" not in p:
+    previous = pack._command_stack[-1] if pack._command_stack else None
+    if isinstance(previous, Branch) and _is_conditional(previous.branches[-1]):
+        # An else if chain, continued from the last else_
+        if else_command.macro:
+            raise RuntimeError(
+                'Macro commands can\'t be used in an else if chain with the "return" branch mode'
+            )
+        return _return_branch(previous, previous.branches[-1], else_command)
+    if not _is_conditional(previous):
         raise RuntimeError(
             "else_ must be directly preceded by an `execute ... if ... run` command"
         )
 
-    previous = p.split("run ")
-    base: str = previous[0]
-    run_command: str = previous[1]
+    # Macro lines can't be moved into a function of their own, as it wouldn't get the macro arguments
+    if (
+        pack.branch_mode == "return"
+        and not previous.macro
+        and not else_command.macro
+        and not _forks(previous)
+    ):
+        return _return_branch(previous, previous, else_command)
+
+    _mark_success(previous)
+    # Make sure that the value isn't 1 due to meddling
+    pack._command_stack.insert(-1, _reset_success())
+    return [
+        Command(
+            "execute",
+            [
+                "unless",
+                "score",
+                "$success",
+                "scute",
+                "matches",
+                1,
+                "run",
+                else_command,
+            ],
+        ),
+        _reset_success(),
+    ]
+
+
+def _is_conditional(command) -> bool:
+    return (
+        isinstance(command, Command)
+        and not isinstance(command, Branch)
+        and command.run is not None
+        and ("if" in command.args or "unless" in command.args)
+    )
+
+
+def _forks(command: Command) -> bool:
+    # Whether an execute command can run its command once for each of several entities - `as`, `at`, `on`,
+    # `positioned as`, `rotated as` and `facing entity`. Returning from one of those would skip the other entities
+    args = command.args[:-2]
+    for i, arg in enumerate(args):
+        if arg in ("as", "at", "on"):
+            return True
+        if arg == "facing" and i + 1 < len(args) and args[i + 1] == "entity":
+            return True
+    return False
 
-    if run_command.startswith("function"):
-        args = run_command.split(" ")
-        namespace, name = args[1].split(":")
+
+def _mark_success(command: Command):
+    # Makes an `execute ... run` command set the $success score to 1 when its command runs, so that the commands after
+    # it know if it did
+    pack._scute_init["scoreboard_needed"] = True
+    run_command = command.run
+    success = Command("scoreboard", ["players", "set", "$success", "scute", 1])
+
+    if _owns_function(run_command):
+        namespace, name = run_command.args[0].split(":")
         # This function will append to an existing file if it already exists (which it does)
-        # Sets the score to 1 if the function runs, so that the next command knows if it succeeded
-        create_function(
-            namespace, name.rstrip(), ["\nscoreboard players set $success scute 1\n"]
-        )
-        # Make sure that the value isn't 1 due to meddling
-        pack._command_stack.insert(-1, "scoreboard players set $success scute 0\n")
+        create_function(namespace, name, [success])
     else:
-        name = uuid4()
-        create_function(
-            pack.namespace,
-            name,
-            [run_command + "\n", "scoreboard players set $success scute 1\n"],
-        )
-        pack._command_stack[-1] = base + f"run function {pack.namespace}:{name}"
+        name = create_anonymous_function(pack.namespace, [run_command, success])
+        command.args[-1] = Command("function", [f"{pack.namespace}:{name}"])
+
+
+def _owns_function(command: Command) -> bool:
+    # Whether a command runs a function made just for it, from a list of commands, which can be patched. Functions
+    # from @func may be run from elsewhere too, and ones with deterministic names may be shared by identical bodies,
+    # so those are wrapped instead
+    if command.kind != "function" or command.macro or pack.deterministic_names:
+        return False
+    location = command.args[0]
+    if not isinstance(location, str):
+        return False
+    namespace, _, name = location.partition(":")
+    file = pack._output.files.get(function_path(namespace, name))
     return (
-        f"execute unless score $success scute matches 1 run {_functionArgument(cmd, True, False)}\n"
-        "scoreboard players set $success scute 0"
+        file is not None and file.generated and location not in pack._function_locations
     )
 
 
+def _return_branch(previous: Command, branch: Command, else_command: Command) -> Branch:
+    # The chain gets a function of its own where every branch returns once it runs, so the next branch only runs if
+    # the ones before it didn't: `execute if A run return run X`, `execute if B run return run Y`, `Z`
+    _take_from_stack([previous])
+    # Changed on a copy, as a list of commands the branch was written in still holds the original
+    branch = Command(branch.kind, list(branch.args), branch.macro)
+    if not _forks(branch):
+        branch.args[-1] = Command("return", ["run", branch.args[-1]])
+        branches = [branch, else_command]
+    else:
+        # A branch run for several entities records whether it ran instead, and the chain returns after it
+        _mark_success(branch)
+        returned = Command(
+            "execute",
+            [
+                "if",
+                "score",
+                "$success",
+                "scute",
+                "matches",
+                1,
+                "run",
+                Command("return", [0]),
+            ],
+        )
+        branches = [_reset_success(), branch, returned, else_command]
+    if isinstance(previous, Branch):
+        previous.branches[-1:] = branches
+        return previous
+    return Branch(branches, [previous])
+
+
+def _reset_success() -> Command:
+    return Command("scoreboard", ["players", "set", "$success", "scute", 0])
+
+
 @_command
 def data_get(data_source: _NbtSource, path: str = None, scale: float = None):
     """
@@ -525,7 +698,7 @@ def data_get(data_source: _NbtSource, path: str = None, scale: float = None):
         path: An optional NBT path to get data from
         scale: An optional scale value to multiply the retrieved value by (if it is a number)
     """
-    return f"data get {data_source.str} {path} {scale}"
+    return Command("data", ["get", data_source.str, path, scale])
 
 
 @_command
@@ -536,7 +709,7 @@ def data_merge(data_source: _NbtSource, nbt: dict):
         data_source: Any child of `scute.datasources.DataSource`, Storage, BlockData, or EntityData
         nbt: NBT to merge (a dict, or nbt())
     """
-    return f"data merge {data_source.str} {dict_to_NBT(nbt)}"
+    return Command("data", ["merge", data_source.str, dict_to_NBT(nbt)])
 
 
 @_command
@@ -547,7 +720,7 @@ def data_remove(data_source: _NbtSource, path: str):
         data_source: Any child of `scute.datasources.DataSource`, Storage, BlockData, or EntityData
         path: The path to the NBT value or compound to remove
     """
-    return f"data remove {data_source.str} {path}"
+    return Command("data", ["remove", data_source.str, path])
 
 
 class DataModification:
@@ -587,7 +760,18 @@ def data_modify_from(
         source: The source which nbt is being copied from
         source_path: Optional path for source
     """
-    return f"data modify {target.str} {path} {modification} from {source.str} {source_path}"
+    return Command(
+        "data",
+        [
+            "modify",
+            target.str,
+            path,
+            str(modification).strip(),
+            "from",
+            source.str,
+            source_path,
+        ],
+    )
 
 
 @_command
@@ -611,7 +795,20 @@ def data_modify_string(
         start: Optional index of first character to include at the start of the string. Negative values are counted from the end of the string.
         end: Optional index of the first character to exclude at the end of the string. Negative values are counted from the end of the string.
     """
-    return f"data modify {target.str} {path} {modification} string {source.str} {source_path} {start} {end}"
+    return Command(
+        "data",
+        [
+            "modify",
+            target.str,
+            path,
+            str(modification).strip(),
+            "string",
+            source.str,
+            source_path,
+            start,
+            end,
+        ],
+    )
 
 
 @_command
@@ -629,4 +826,6 @@ def data_modify_value(
     val = value
     if isinstance(value, dict):
         val = dict_to_NBT(value)
-    return f"data modify {target.str} {path} {modification} value {val}"
+    return Command(
+        "data", ["modify", target.str, path, str(modification).strip(), "value", val]
+    )
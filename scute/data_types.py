@@ -1,7 +1,6 @@
 """
 Various data types used in NBT.
 """
-from typing import TypeVar, Union
 
 
 class _NumberType:
@@ -20,6 +19,20 @@ class _NumberType:
     def getNbt(self):
         return str(self.number) + self.letter
 
+    def __eq__(self, other):
+        # Byte(1) and Short(1) are different nbt, and so are Float(1) and Float(1.0)
+        return (
+            type(self) is type(other)
+            and type(self.number) is type(other.number)
+            and self.number == other.number
+        )
+
+    def __hash__(self):
+        return hash((type(self), self.number))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.number!r})"
+
 
 class Byte(_NumberType):
     letter = "b"
@@ -44,5 +57,42 @@ class Double(_NumberType):
     letter = "d"
 
 
-_NumberTypeVar = TypeVar("_NumberTypeVar", bound=_NumberType)
-_NbtValue = Union[_NumberTypeVar, int, str, float, dict]
+class _ArrayType(list):
+    letter = None
+    element = None
+
+    def __str__(self):
+        return self.getNbt()
+
+    def getNbt(self):
+        return (
+            f"[{self.letter}; "
+            + ", ".join(
+                self.element(getattr(value, "number", value)).getNbt() for value in self
+            )
+            + "]"
+        )
+
+
+class _Int(_NumberType):
+    # Ints have no suffix, so only arrays use this
+    letter = ""
+    int = True
+
+
+class ByteArray(_ArrayType):
+    letter = "B"
+    element = Byte
+
+
+class IntArray(_ArrayType):
+    letter = "I"
+    element = _Int
+
+
+class LongArray(_ArrayType):
+    letter = "L"
+    element = Long
+
+
+_NbtValue = _NumberType | int | str | float | dict
@@ -1,45 +1,13 @@
 """
 Enum for all enchantments in Minecraft.
 """
+from scute.internal.registry import RegistryEnum
 
 
-class Enchantment:
-    aqua_affinity = "aqua_affinity"
-    bane_of_arthropods = "bane_of_arthropods"
-    binding_curse = "binding_curse"
-    blast_protection = "blast_protection"
-    channeling = "channeling"
-    depth_strider = "depth_strider"
-    efficiency = "efficiency"
-    feather_falling = "feather_falling"
-    fire_aspect = "fire_aspect"
-    fire_protection = "fire_protection"
-    flame = "flame"
-    fortune = "fortune"
-    frost_walker = "frost_walker"
-    impaling = "impaling"
-    infinity = "infinity"
-    knockback = "knockback"
-    looting = "looting"
-    loyalty = "loyalty"
-    luck_of_the_sea = "luck_of_the_sea"
-    lure = "lure"
-    mending = "mending"
-    multishot = "multishot"
-    piercing = "piercing"
-    power = "power"
-    projectile_protection = "projectile_protection"
-    protection = "protection"
-    punch = "punch"
-    quick_charge = "quick_charge"
-    respiration = "respiration"
-    riptide = "riptide"
-    sharpness = "sharpness"
-    silk_touch = "silk_touch"
-    smite = "smite"
-    soul_speed = "soul_speed"
-    sweeping = "sweeping"
-    swift_sneak = "swift_sneak"
-    thorns = "thorns"
-    unbreaking = "unbreaking"
-    vanishing_curse = "vanishing_curse"
+class Enchantment(metaclass=RegistryEnum):
+    """
+    Every enchantment id is an attribute, like `Enchantment.mending`, and `"mending" in Enchantment` checks if an id exists.
+    `Enchantment.ids("1.20.1")` returns every enchantment id in a version
+    """
+
+    _registry = "enchantment"
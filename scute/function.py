@@ -1,11 +1,16 @@
-from uuid import uuid4
+from types import CodeType, FunctionType
 
-from scute import pack, _function_namespaces
+from scute import pack
 from scute.internal.dict_to_NBT import dict_to_NBT
 from scute.data_sources import DataSource, _NbtSource
-from inspect import signature
 
-from scute.internal.utils import format_text, create_function
+from scute.internal.command import Command, render_function
+
+from scute.internal.utils import (
+    format_text,
+    create_function,
+    create_anonymous_function,
+)
 
 
 class _MacroArguments:
@@ -28,6 +33,96 @@ class _MacroArg:
         return self.arg
 
 
+def _takes_arguments(function) -> bool:
+    # Checked on the code object rather than with inspect.signature, as importing inspect is slow
+    code = getattr(function, "__code__", None)
+    if code is None:
+        from inspect import signature
+
+        return len(signature(function).parameters) > 0
+    # 0x04 and 0x08 are the *args and **kwargs flags
+    return code.co_argcount + code.co_kwonlyargcount > 0 or code.co_flags & 0x0C != 0
+
+
+class _Recording:
+    __slots__ = ("location", "files", "scoreboard_needed")
+
+    def __init__(self, location: str, files: dict, scoreboard_needed: bool):
+        """
+        What creating a function produced, so that a function cache can create it again without running it
+        Args:
+            location: The function's resource location
+            files: Every file written while it was created, by path - itself and the functions it made
+            scoreboard_needed: Whether it needs the scute scoreboard
+        """
+        self.location = location
+        self.files = files
+        self.scoreboard_needed = scoreboard_needed
+
+
+# Global values that are used in a function's fingerprint
+_SIMPLE_TYPES = (int, float, str, bool, bytes, tuple, type(None))
+
+
+def _global_names(code: CodeType) -> set[str]:
+    # The global names used by the code and the functions and lambdas inside it
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _global_names(const)
+    return names
+
+
+def _describe(value):
+    if isinstance(value, FunctionType):
+        value = getattr(value, "unwrapped", value)
+        return value.__module__, value.__qualname__
+    return value
+
+
+def _fingerprint(function) -> str | None:
+    """
+    Describes everything besides a function's code that what it creates depends on - the values it closes over, its
+    default arguments, the simple global values it uses, like loop variables, and the settings of the pack.
+    Returns None if one of them can't be told apart from another object of its type
+    """
+    values = []
+    for cell in function.__closure__ or ():
+        try:
+            values.append(_describe(cell.cell_contents))
+        except ValueError:
+            values.append(None)
+    values += [function.__defaults__, function.__kwdefaults__]
+    namespace = function.__globals__
+    for name in sorted(_global_names(function.__code__)):
+        value = namespace.get(name)
+        if isinstance(value, _SIMPLE_TYPES):
+            values.append((name, value))
+    values.append(
+        (
+            pack.namespace,
+            pack.branch_mode,
+            pack.deterministic_names,
+            pack.meta["pack"]["pack_format"],
+        )
+    )
+    text = repr(values)
+    # Objects with the default repr are only told apart by their address, which changes between builds
+    if " at 0x" in text:
+        return None
+    return text
+
+
+def _side_effects() -> tuple:
+    # Changes to these while a function is created mean it can't be replayed from its files alone
+    return (
+        sum(len(functions) for functions in pack._tags.values()),
+        len(pack._scoreboard_list),
+        sum(len(functions) for functions in pack._periodic.values()),
+        len(pack._scute_init["commands"]),
+    )
+
+
 def func(function_namespace=None, function_name=None):
     """
     A decorator that creates a function in your datapack. You can provide an optional namespace and name,
@@ -39,38 +134,102 @@ def func(function_namespace=None, function_name=None):
     .. include:: ../pdoc/documentation/functions.md
     """
 
-    def decorator(function):
-        if function not in _function_namespaces:
-            sig = signature(function)
-            if len(sig.parameters) > 0:
+    def create(function):
+        # Builds the function into the pack of the current context, or replays it from the function cache
+        space = function_namespace or pack.namespace
+        cache = pack._function_cache
+        if cache is not None:
+            recording = cache.get(function, space, function_name)
+            if recording is not None:
+                pack._output.add_files(recording.files)
+                pack._function_namespaces[function] = recording.location
+                pack._function_locations.add(recording.location)
+                if recording.scoreboard_needed:
+                    pack._scute_init["scoreboard_needed"] = True
+                print(format_text(f"Reused function {recording.location}", 32))
+                return
+            side_effects = _side_effects()
+            scoreboard_needed = pack._scute_init["scoreboard_needed"]
+            pack._output.start_recording()
+
+        profiler = pack._profiler
+        if profiler:
+            start = profiler.start()
+
+        # Functions can be created while another one is being built (like execute().run(my_func)),
+        # so the commands of the outer function are put aside until this one is done
+        outer_stack = pack._command_stack
+        pack._command_stack = []
+
+        try:
+            if _takes_arguments(function):
                 function(_MacroArguments())
             else:
                 function()
-            name = function_name or uuid4()
-            space = function_namespace or pack.namespace
-
-            _function_namespaces[function] = f"{space}:{name}"
 
-            create_function(space, name, pack._command_stack)
+            commands = pack._command_stack
+            pack._command_stack = outer_stack
 
-            pack._command_stack = []
+            if function_name:
+                name = function_name
+                create_function(space, name, commands)
+            else:
+                name = create_anonymous_function(space, commands)
+        finally:
+            if cache is not None:
+                files = pack._output.stop_recording()
+
+        pack._function_namespaces[function] = f"{space}:{name}"
+        pack._function_locations.add(f"{space}:{name}")
+
+        if cache is not None and files is not None and side_effects == _side_effects():
+            cache.put(
+                function,
+                space,
+                function_name,
+                _Recording(
+                    f"{space}:{name}",
+                    files,
+                    pack._scute_init["scoreboard_needed"] and not scoreboard_needed,
+                ),
+            )
+
+        if profiler:
+            profiler.record(
+                "function",
+                f"{space}:{name}",
+                profiler.stop(start),
+                len(commands),
+                len(render_function(commands).encode()),
+                (function.__module__, function.__code__.co_firstlineno),
+            )
+
+        print(format_text(f"Created function {space}:{name}", 32))
 
-            print(format_text(f"Created function {space}:{name}", 32))
+    def decorator(function):
+        if function not in pack._function_namespaces:
+            create(function)
 
         # Code run if the function is called
         def wrapper(args: dict | _NbtSource = None, path=None):
-            command = f"function {_function_namespaces[function]}"
+            # Functions are made when they're decorated, but a function from an earlier pack can be called while
+            # building another one, which doesn't have it yet
+            if function not in pack._function_namespaces:
+                create(function)
+            command = Command("function", [pack._function_namespaces[function]])
             if isinstance(args, dict):
-                command += " " + dict_to_NBT(args)
+                command.args.append(dict_to_NBT(args))
                 if path is not None:
                     print(
                         "Warning: Macro argument path should not be specified when using hardcoded nbt."
                     )
             elif issubclass(type(args), DataSource):
-                command += f" with {args.str} {path}"
-            pack._command_stack.append(command + "\n")
+                command.args += ["with", args.str, path]
+            pack._command_stack.append(command)
+            return command
 
         wrapper.unwrapped = function
+        wrapper.create = create
 
         return wrapper
 
@@ -0,0 +1,62 @@
+"""
+Reads the call counts of a pack built with `scute.pack.set_instrumented` back from a saved world.
+
+    python -m scute.instrumentation path/to/world --top 20
+"""
+import argparse
+import json
+import os
+
+from scute import binary_nbt
+
+# The scoreboard every instrumented function counts its calls on
+CALLS_OBJECTIVE = "scute_calls"
+
+
+def read_call_counts(path: str, objective: str = CALLS_OBJECTIVE) -> dict[str, int]:
+    """
+    Reads the call count of every function from a world's scoreboard data
+    Args:
+        path: The world folder, or the path of its data/scoreboard.dat
+        objective: The scoreboard the calls were counted on
+    Returns:
+        A dict of function locations to the number of times they were called
+    """
+    if os.path.isdir(path):
+        path = os.path.join(path, "data", "scoreboard.dat")
+    root = binary_nbt.load(path)
+
+    counts = {}
+    for score in root.get("data", {}).get("PlayerScores", []):
+        if score.get("Objective") == objective:
+            counts[score["Name"]] = score.get("Score", 0)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("world", help="The world folder, or its data/scoreboard.dat")
+    parser.add_argument(
+        "--top", type=int, default=30, help="How many functions to print"
+    )
+    parser.add_argument("--output", help="Also write every count to this json file")
+    parser.add_argument(
+        "--objective",
+        default=CALLS_OBJECTIVE,
+        help="The scoreboard calls were counted on",
+    )
+    args = parser.parse_args()
+
+    counts = read_call_counts(args.world, args.objective)
+    total = sum(counts.values())
+    print(f"{len(counts)} functions, {total} calls")
+    for location, count in sorted(counts.items(), key=lambda c: -c[1])[: args.top]:
+        print(f"  {count:12} {count / total if total else 0:7.1%}  {location}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(counts, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""
+The stages a pack goes through when it's built, once everything in it has been created:
+
+- collect: creates the files made from what was collected while the script ran - function tags, scute_init and the
+  tick dispatcher
+- optimize: optimizes, deduplicates, shortens the names of and instruments functions, if those are turned on
+- validate: checks resource locations and function references, printing a warning for each problem
+- serialize: renders every file to text
+- write: writes the files to disk or a zip archive
+
+Stages work on a copy of the pack's output tree, so a pack can be built again and gets the same result.
+"""
+import re
+import time
+
+from scute import Pack, _current, _stages
+from scute.internal.command import Command
+from scute.internal.output_tree import OutputTree
+from scute.internal.utils import format_text, create_function
+
+# Resource locations can only have these characters, and namespaces can't have slashes
+_LOCATION = re.compile(r"[a-z0-9_.-]+:[a-z0-9_./-]+")
+
+
+class Build:
+    def __init__(self, pack: Pack):
+        """
+        A single build of a pack, passed to build hooks
+        Args:
+            pack: The pack being built
+        """
+        self.pack = pack
+        # The files of the pack, as the stages leave them
+        self.tree: OutputTree = pack._output.copy()
+        # The text of every file by its path, once it's been serialized
+        self.rendered: dict[str, str] | None = None
+        # The new locations of functions that were renamed when minifying, by their old location
+        self.short_names: dict[str, str] = {}
+        # The seconds each stage took, in the order they ran
+        self.times: dict[str, float] = {}
+        self.warnings: list[str] = []
+
+
+def run_build(pack: Pack) -> Build:
+    """
+    Runs every stage of the build, with the hooks added with `scute.Pack.add_build_hook`
+    Args:
+        pack: The pack to build
+    Returns:
+        The finished build
+    """
+    build = Build(pack)
+    # Files created by the stages go in the build's tree, not the pack's
+    source = pack._output
+    pack._output = build.tree
+    token = _current.set(pack)
+    pack._hashed_names = True
+    try:
+        for stage in _stages:
+            start = time.perf_counter()
+            for hook in pack._hooks[stage][0]:
+                hook(build)
+            _STAGES[stage](pack, build)
+            for hook in pack._hooks[stage][1]:
+                hook(build)
+            build.times[stage] = time.perf_counter() - start
+    finally:
+        _current.reset(token)
+        pack._output = source
+        pack._hashed_names = False
+    return build
+
+
+def _collect(pack: Pack, build: Build):
+    from scute.tags import _create_tag_file, _create_tick_dispatcher
+
+    # Copies, so that building doesn't change what was collected
+    tags = {tag: list(functions) for tag, functions in pack._tags.items()}
+    init = list(pack._scute_init["commands"])
+    scoreboard_needed = pack._scute_init["scoreboard_needed"]
+
+    if pack._scoreboard_list:
+        from scute.scoreboards import _scoreboard_commands
+
+        init += _scoreboard_commands()
+
+    if pack._periodic:
+        _create_tick_dispatcher(tags)
+        scoreboard_needed = True
+
+    if pack.instrumented:
+        from scute.instrumentation import CALLS_OBJECTIVE
+
+        init.append(
+            Command("scoreboard", ["objectives", "add", CALLS_OBJECTIVE, "dummy"])
+        )
+
+    if init or scoreboard_needed:
+        namespace = pack.namespace + ":scute_init"
+
+        if "minecraft:load" not in tags:
+            tags["minecraft:load"] = [namespace]
+        elif namespace not in tags["minecraft:load"]:
+            tags["minecraft:load"].append(namespace)
+
+        if scoreboard_needed:
+            init.append(Command("scoreboard", ["objectives", "add", "scute", "dummy"]))
+
+        create_function(pack.namespace, "scute_init", init)
+
+    for tag, functions in tags.items():
+        namespace, name = tag.split(":")
+        source = None
+        if pack._profiler:
+            source = pack._profiler.tag_sources.get(tag, ("<build>", 0))
+        _create_tag_file(namespace, name, "functions", functions, source)
+        print(format_text(f"Successfully created function tag {namespace}:{name}", 32))
+
+
+def _optimize(pack: Pack, build: Build):
+    from scute.internal.optimize import (
+        deduplicate_functions,
+        optimize_functions,
+        shorten_function_names,
+    )
+
+    if pack.optimize:
+        removed = optimize_functions(build.tree)
+        print(format_text(f"Optimized away {removed} commands", 32))
+
+    if pack.deduplicate:
+        removed = deduplicate_functions(build.tree)
+        print(format_text(f"Removed {removed} duplicate functions", 32))
+
+    if pack.minify:
+        build.short_names = shorten_function_names(build.tree, pack.deterministic_names)
+        print(format_text(f"Shortened {len(build.short_names)} function names", 32))
+
+    # Done last, so that the counters aren't optimized or deduplicated away
+    if pack.instrumented:
+        from scute.tags import _instrument
+
+        _instrument()
+
+
+def _validate(pack: Pack, build: Build):
+    from scute.internal.optimize import _function_location, tree_references
+
+    functions = set()
+    namespaces = set()
+    for path in build.tree.files:
+        location = _function_location(path)
+        if location is not None:
+            functions.add(location)
+            namespaces.add(location.partition(":")[0])
+            if not _LOCATION.fullmatch(location):
+                build.warnings.append(f"Invalid function name {location}")
+
+    # Only references to this pack's own namespaces can be checked
+    for path, location, _ in tree_references(build.tree):
+        if location.partition(":")[0] in namespaces and location not in functions:
+            build.warnings.append(f"{path} refers to missing function {location}")
+
+    if "pack.mcmeta" not in build.tree.files:
+        build.warnings.append("There's no pack.mcmeta - was pack.check_valid() run?")
+
+    for warning in build.warnings:
+        print(format_text(f"Warning: {warning}", 33))
+
+
+def _serialize(pack: Pack, build: Build):
+    build.rendered = build.tree.render(pack.minify)
+
+
+def _write(pack: Pack, build: Build):
+    pack._write_output(build.rendered)
+
+
+_STAGES = {
+    "collect": _collect,
+    "optimize": _optimize,
+    "validate": _validate,
+    "serialize": _serialize,
+    "write": _write,
+}
@@ -0,0 +1,136 @@
+"""
+The intermediate representation of commands - every command is kept as its parts until the pack is written
+"""
+
+
+class Command:
+    __slots__ = ("kind", "args", "macro")
+
+    def __init__(self, kind: str, args: list = None, macro: bool = False):
+        """
+        A single command
+        Args:
+            kind: The command's name, like "give" or "execute"
+            args: The arguments, in order. None is skipped when rendering, and a Command is rendered inline
+                (used for the command after `execute ... run`)
+            macro: Whether the command contains macro arguments, and needs to be prefixed with $
+        """
+        self.kind = kind
+        self.args = args if args is not None else []
+        self.macro = macro
+
+    @staticmethod
+    def parse(text: str) -> "Command":
+        """
+        Creates a command from a raw string, like one passed to `scute.commands.run_raw`
+        """
+        macro = text.startswith("$")
+        if macro:
+            text = text[1:]
+        kind, _, rest = text.strip().partition(" ")
+        return Command(kind, [rest] if rest else [], macro)
+
+    @property
+    def run(self) -> "Command | None":
+        """
+        The command run at the end of an `execute ... run`, if there is one
+        """
+        if self.kind == "execute" and len(self.args) >= 2 and self.args[-2] == "run":
+            return self.args[-1]
+        return None
+
+    def __str__(self):
+        # Without the macro prefix, so that commands can be nested in `execute ... run`
+        if not self.args:
+            return self.kind
+        return " ".join(
+            [self.kind] + [str(arg) for arg in self.args if arg is not None]
+        )
+
+    def render(self) -> str:
+        """
+        Returns the command as a line of an mcfunction file
+        """
+        if self.macro:
+            return "$" + str(self)
+        return str(self)
+
+    def __repr__(self):
+        return f"Command({self.render()!r})"
+
+
+class Branch(Command):
+    __slots__ = ("branches", "replaced")
+
+    def __init__(self, branches: list[Command], replaced: list[Command] = None):
+        """
+        A call to the function holding an if/else chain, used by the "return" branch mode of `scute.commands.else_`.
+        Branches can be added until the function containing it is created, which is when the chain gets its own
+        function and this command gets its location
+        Args:
+            branches: The commands of the chain, where every branch but the last is `execute ... run return run ...`
+            replaced: The commands the chain was made from, which it runs instead
+        """
+        super().__init__("function", [None])
+        self.branches = branches
+        self.replaced = replaced or []
+
+
+def inner_command(command: Command) -> Command | None:
+    """
+    Returns the command run by a command - after `execute ... run`, or `return run` - if there is one
+    """
+    if command.kind == "return":
+        args = command.args
+        if len(args) == 2 and args[0] == "run" and isinstance(args[1], Command):
+            return args[1]
+        return None
+    run = command.run
+    return run if isinstance(run, Command) else None
+
+
+def nested_commands(command: Command):
+    """
+    Yields a command, and every command nested inside it, like `give` in `execute as @a run return run give ...`
+    """
+    while command is not None:
+        yield command
+        command = inner_command(command)
+
+
+def function_references(command: Command):
+    """
+    Yields the location of every function a command (or a command nested inside it) runs or schedules, and whether
+    it's scheduled. Macro lines are skipped, as their locations aren't known until they run
+    """
+    for command in nested_commands(command):
+        if command.macro:
+            continue
+        args = command.args
+        if command.kind == "function" and args and args[0] is not None:
+            # Raw commands keep their arguments together
+            yield str(args[0]).partition(" ")[0], False
+        elif command.kind == "schedule" and args:
+            if len(args) > 1 and args[0] == "function":
+                yield str(args[1]), True
+            elif len(args) == 1 and str(args[0]).startswith("function "):
+                yield str(args[0]).split(" ")[1], True
+
+
+def render_function(commands: list[Command], minify: bool = False) -> str:
+    """
+    Returns the contents of an mcfunction file containing the commands
+    Args:
+        commands: The commands
+        minify: Leaves out blank lines, comments and indentation
+    """
+    if minify:
+        return "".join(
+            [
+                line.strip() + "\n"
+                for command in commands
+                for line in command.render().splitlines()
+                if line.strip() and not line.lstrip().startswith("#")
+            ]
+        )
+    return "".join([command.render() + "\n" for command in commands])
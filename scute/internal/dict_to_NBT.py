@@ -1,63 +1,204 @@
-import json
-
-from scute.data_types import _NumberType
-
-
-def encode_value(value):
-    out = ""
-    # If the value is a NBT number like 1b, get its NBT representation
-    if issubclass(type(value), _NumberType):
-        out += value.getNbt()
-    # If the value is a dict or list, encode it
-    elif isinstance(value, dict) or isinstance(value, list):
-        out += encode_dict_or_list(value)
-    # If the value is a string, just add it
-    elif isinstance(value, str):
-        escapedValue = value.replace("'", "\\'")
-        out += f"'{escapedValue}'"
-    # If the value is an int, just add it
-    elif isinstance(value, int) or isinstance(value, float):
-        out += str(value)
-
-    return out
-
-
-def encode_dict_or_list(obj):
-    out = ""
-    index = 0
-    if isinstance(obj, dict):
-        out = "{"
-        # Loop through keys and values of the dict
-        for key, value in obj.items():
-            if index != 0:
-                out += ", "
-
-            # Add the key and value to the output
-            out += str(key) + ": "
-            out += encode_value(value)
-            index += 1
-
-        out += "}"
-
-    elif isinstance(obj, list):
-        out += "["
-        for value in obj:
-            if index != 0:
-                out += ", "
-            out += encode_value(value)
-
-        out += "]"
-
-    return out
-
-
-class dtn(json.JSONEncoder):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-    def encode(self, obj):
-        return encode_dict_or_list(obj)
-
-
-def dict_to_NBT(dic):
-    return json.dumps(dic, cls=dtn)
+"""
+Encodes python values as SNBT, the text form of NBT used in commands
+"""
+from collections.abc import Mapping
+
+from scute.data_types import _NumberType, _ArrayType
+
+# Keys made only of these characters don't need quotes
+_UNQUOTED_KEY = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_-.+"
+)
+
+
+def to_snbt(value, compact: bool = False, indent: int = None) -> str:
+    """
+    Encodes a value as SNBT. The whole output is collected in one list and joined once, so it takes linear time
+    Args:
+        value: A dict, list, string, number, or a type from `scute.data_types`
+        compact: Leaves out the spaces after commas and colons
+        indent: Puts every entry of compounds and lists of compounds on its own line, indented by this many spaces
+    """
+    out = []
+    if indent is not None:
+        _encode_pretty(value, out, " " * indent, "\n")
+    else:
+        _encode(value, out, "," if compact else ", ", ":" if compact else ": ")
+    return "".join(out)
+
+
+# Encoded nbt by its structure, so identical nbt (like the same item given many times) is only encoded once
+_encoded = {}
+_MAX_CACHED = 50_000
+
+
+def _freeze(value):
+    # A hashable copy of the nbt that's only equal to nbt that encodes to the same text - unlike ==, it keeps key
+    # order and tells 1, 1.0 and True apart. Strings and ints are kept as they are, everything else is tagged
+    kind = type(value)
+    if kind is str or kind is int:
+        return value
+    if kind is dict or (kind is not list and isinstance(value, Mapping)):
+        return ("{",) + tuple(
+            [(key, _freeze(item)) for key, item in value.items() if item is not None]
+        )
+    if kind is list or kind is tuple:
+        return ("[",) + tuple([_freeze(item) for item in value if item is not None])
+    if isinstance(value, _ArrayType):
+        return kind, tuple(value)
+    if isinstance(value, _NumberType):
+        return kind, type(value.number), value.number
+    return kind, value
+
+
+def cached_snbt(nbt) -> str:
+    """
+    Like `dict_to_NBT`, but remembers the result for each distinct structure. Changing the nbt afterwards changes its
+    structure too, so it's never out of date
+    """
+    if nbt is None:
+        return ""
+    key = _freeze(nbt)
+    text = _encoded.get(key)
+    if text is None:
+        if len(_encoded) >= _MAX_CACHED:
+            _encoded.clear()
+        text = _encoded[key] = to_snbt(nbt)
+    return text
+
+
+def dict_to_NBT(dic) -> str:
+    """
+    Encodes an nbt compound for use in a command, or returns "" for None so it can be appended to an id
+    """
+    if dic is None:
+        return ""
+    return to_snbt(dic)
+
+
+# Keys are cached, as the same few are used over and over
+_keys = {}
+
+
+def _key(key) -> str:
+    quoted = _keys.get(key)
+    if quoted is None:
+        text = str(key)
+        if text and _UNQUOTED_KEY.issuperset(text):
+            quoted = text
+        else:
+            quoted = '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        if len(_keys) < 10_000:
+            _keys[key] = quoted
+    return quoted
+
+
+def _string(value: str) -> str:
+    if "'" in value or "\\" in value:
+        value = value.replace("\\", "\\\\").replace("'", "\\'")
+    return "'" + value + "'"
+
+
+def _scalar(value) -> str:
+    if isinstance(value, _NumberType):
+        return value.getNbt()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return _string(str(value))
+
+
+def _array(value: _ArrayType, separator: str) -> str:
+    suffix = value.element.letter
+    numbers = [
+        item if type(item) is int else int(str(item).rstrip(suffix)) for item in value
+    ]
+    if not numbers:
+        return f"[{value.letter};]"
+    return (
+        f"[{value.letter};{separator[1:]}"
+        + (suffix + separator).join(map(str, numbers))
+        + suffix
+        + "]"
+    )
+
+
+def _encode(value, out: list, separator: str, colon: str):
+    append = out.append
+    cached_key = _keys.get
+
+    def encode(value):
+        # The common exact types are checked first, as isinstance checks against Mapping are slow. Every entry is
+        # followed by a separator, and the last one is replaced by the closing bracket
+        kind = type(value)
+        if kind is str:
+            if "'" in value or "\\" in value:
+                append(_string(value))
+            else:
+                append("'" + value + "'")
+        elif kind is int:
+            append(str(value))
+        elif kind is dict or (kind is not list and isinstance(value, Mapping)):
+            append("{")
+            start = len(out)
+            for key, item in value.items():
+                if item is not None:
+                    append(cached_key(key) or _key(key))
+                    append(colon)
+                    encode(item)
+                    append(separator)
+            if len(out) > start:
+                out[-1] = "}"
+            else:
+                append("}")
+        elif kind is list or kind is tuple:
+            append("[")
+            start = len(out)
+            for item in value:
+                if item is not None:
+                    encode(item)
+                    append(separator)
+            if len(out) > start:
+                out[-1] = "]"
+            else:
+                append("]")
+        elif isinstance(value, _ArrayType):
+            append(_array(value, separator))
+        elif isinstance(value, list):
+            encode(list(value))
+        else:
+            append(_scalar(value))
+
+    encode(value)
+
+
+def _encode_pretty(value, out: list, indent: str, newline: str):
+    # Lists of plain values stay on one line
+    if isinstance(value, Mapping):
+        items = [(key, item) for key, item in value.items() if item is not None]
+    elif isinstance(value, (list, tuple)) and not isinstance(value, _ArrayType):
+        items = [(None, item) for item in value if item is not None]
+        if not any(isinstance(item, (Mapping, list, tuple)) for _, item in items):
+            _encode(value, out, ", ", ": ")
+            return
+    else:
+        _encode(value, out, ", ", ": ")
+        return
+
+    is_compound = isinstance(value, Mapping)
+    if not items:
+        out.append("{}" if is_compound else "[]")
+        return
+    inner = newline + indent
+    out.append("{" if is_compound else "[")
+    for i, (key, item) in enumerate(items):
+        if i:
+            out.append(",")
+        out.append(inner)
+        if is_compound:
+            out.append(_key(key))
+            out.append(": ")
+        _encode_pretty(item, out, indent, inner)
+    out.append(newline)
+    out.append("}" if is_compound else "]")
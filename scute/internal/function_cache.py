@@ -0,0 +1,251 @@
+"""
+An on-disk cache of what functions created, turned on with `scute.Pack.set_cache_dir`. A function whose code and
+inputs haven't changed since an earlier build is created from the cache, without running its body.
+
+A function's key is a hash of its bytecode, the bytecode of the plain python functions it calls, the values it closes
+over, the global values it and those functions use, the locations of the functions it calls, the pack's settings and
+the version of scute. Global values are hashed by what's in them, so only simple values, containers of them and objects
+from scute can be - functions that use anything else, like instances of their own classes, aren't cached. Entries are
+pickled, one file each, and the least recently used ones are deleted once the cache gets too big. Only use cache
+folders you trust, as loading a pickle can run code.
+"""
+import os
+import sys
+import threading
+from os.path import join
+from enum import Enum
+from types import BuiltinFunctionType, CodeType, FunctionType, ModuleType
+
+from scute import pack
+from scute.function import _Recording, _SIMPLE_TYPES, _fingerprint, _global_names
+
+# Bumped when the format of entries changes
+_FORMAT = 1
+
+
+def _scute_version() -> str:
+    # The installed version, or for a source checkout, when scute's files were last changed
+    try:
+        from importlib.metadata import version
+
+        return version("scutemc")
+    except Exception:
+        root = os.path.dirname(os.path.dirname(__file__))
+        latest = 0.0
+        for folder, _, files in os.walk(root):
+            for file in files:
+                if file.endswith(".py"):
+                    latest = max(latest, os.path.getmtime(join(folder, file)))
+        return f"dev-{latest}"
+
+
+def _hash_code(code: CodeType, digest):
+    digest.update(code.co_code)
+    digest.update(" ".join(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(const, digest)
+        elif isinstance(const, frozenset):
+            # Sets are ordered by hash, which changes between processes
+            digest.update(repr(sorted(const, key=repr)).encode())
+        else:
+            digest.update(repr(const).encode())
+
+
+def _is_external(function) -> bool:
+    # Functions from scute are covered by its version, and ones from the standard library don't change
+    module = (function.__module__ or "").partition(".")[0]
+    return module == "scute" or module in sys.stdlib_module_names
+
+
+def _hash_function(function, digest, seen: set) -> bool:
+    # Hashes the code of a function, and everything it uses. Returns False if something it uses can't be hashed
+    if id(function) in seen:
+        return True
+    seen.add(id(function))
+    fingerprint = _fingerprint(function)
+    if fingerprint is None:
+        return False
+    digest.update(fingerprint.encode())
+    code = function.__code__
+    _hash_code(code, digest)
+    names = _global_names(code)
+    namespace = function.__globals__
+    for name in sorted(names):
+        if name in namespace and not _hash_value(
+            name, namespace[name], names, digest, seen
+        ):
+            return False
+    return True
+
+
+def _hash_value(name: str, value, names: set, digest, seen: set) -> bool:
+    # Returns False for values that can't be hashed, as the function might depend on what's in them
+    if isinstance(value, FunctionType) and hasattr(value, "unwrapped"):
+        # A call to a function from @func only depends on its location, which can only be known once it's created
+        location = pack._function_namespaces.get(value.unwrapped)
+        if location is None:
+            return False
+        digest.update(f"{name}->{location}".encode())
+    elif isinstance(value, FunctionType):
+        if not _is_external(value):
+            digest.update(name.encode())
+            return _hash_function(value, digest, seen)
+    elif isinstance(value, ModuleType):
+        # Attributes of modules, like helpers.make_ring(), are global names of the code too
+        for attribute in sorted(names):
+            if attribute in vars(value) and not _hash_value(
+                f"{name}.{attribute}", vars(value)[attribute], set(), digest, seen
+            ):
+                return False
+    elif isinstance(value, (type, BuiltinFunctionType)):
+        # Classes can't be hashed by their contents, so only ones that don't change between builds are allowed
+        return _is_external(value)
+    else:
+        text = _value_repr(value, set())
+        if text is None:
+            return False
+        digest.update(f"{name}={text}".encode())
+    return True
+
+
+def _value_repr(value, containing: set) -> str | None:
+    # Describes data - simple values, containers of them and objects from scute - or returns None if it can't
+    if isinstance(value, (int, float, str, bytes, type(None), Enum)):
+        return repr(value)
+    if id(value) in containing:
+        # Containers that contain themselves
+        return None
+    containing = containing | {id(value)}
+    if isinstance(value, (list, tuple)):
+        items = [_value_repr(item, containing) for item in value]
+    elif isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            key, item = _value_repr(key, containing), _value_repr(item, containing)
+            items.append(None if key is None or item is None else f"{key}: {item}")
+    elif isinstance(value, (set, frozenset)):
+        # Sets are ordered by hash, which changes between processes
+        items = [_value_repr(item, containing) for item in value]
+        if None in items:
+            return None
+        items.sort()
+    elif _is_external(type(value)) and hasattr(value, "__dict__"):
+        # Objects from scute, like scoreboards and items, are described by what's in them
+        items = [_value_repr(vars(value), containing)]
+    else:
+        return None
+    if None in items:
+        return None
+    return f"{type(value).__qualname__}({', '.join(items)})"
+
+
+class DiskCache:
+    def __init__(self, path: str, max_size: int):
+        """
+        A folder of cached functions
+        Args:
+            path: The folder
+            max_size: The most bytes the cache can take up
+        """
+        self.path = path
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._version = None
+        # {file path: (size, last used)}, read from the folder the first time something is stored
+        self._index = None
+        self._size = 0
+
+    def _key(self, function, namespace: str, name: str | None) -> str | None:
+        import hashlib
+
+        if self._version is None:
+            self._version = _scute_version()
+
+        digest = hashlib.sha256()
+        for part in (_FORMAT, self._version, function.__qualname__, namespace, name):
+            digest.update(f"{part}\0".encode())
+        if not _hash_function(function, digest, set()):
+            return None
+        return digest.hexdigest()
+
+    def _file(self, key: str) -> str:
+        return join(self.path, key[:2], key[2:] + ".pickle")
+
+    def get(self, function, namespace: str, name: str | None) -> _Recording | None:
+        key = self._key(function, namespace, name)
+        if key is None:
+            return None
+        import pickle
+
+        file = self._file(key)
+        try:
+            with open(file, "rb") as f:
+                recording = pickle.load(f)
+            # The modified time is when it was last used, for evicting the least recently used entries
+            os.utime(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            self.misses += 1
+            return None
+        if self._index is not None and file in self._index:
+            self._index[file] = (self._index[file][0], os.path.getmtime(file))
+        self.hits += 1
+        return recording
+
+    def put(self, function, namespace: str, name: str | None, recording: _Recording):
+        key = self._key(function, namespace, name)
+        if key is None:
+            return
+        import pickle
+
+        try:
+            data = pickle.dumps(recording, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Commands can hold objects that can't be pickled
+            return
+
+        file = self._file(key)
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        # Written to a temporary file first, so that other builds never read half an entry
+        temporary = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, file)
+
+        index = self._load_index()
+        if file in index:
+            self._size -= index[file][0]
+        index[file] = (len(data), os.path.getmtime(file))
+        self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _load_index(self) -> dict[str, tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            for folder, _, files in os.walk(self.path):
+                for file in files:
+                    if file.endswith(".pickle"):
+                        path = join(folder, file)
+                        try:
+                            stat = os.stat(path)
+                        except OSError:
+                            continue
+                        self._index[path] = (stat.st_size, stat.st_mtime)
+                        self._size += stat.st_size
+        return self._index
+
+    def _evict(self):
+        # Deletes the least recently used entries until the cache is below 90% of its size limit, so that it isn't
+        # done again for every entry stored after that
+        index = self._index
+        for file, (size, _) in sorted(index.items(), key=lambda entry: entry[1][1]):
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+            del index[file]
+            self._size -= size
+            if self._size <= self.max_size * 0.9:
+                break
@@ -0,0 +1,291 @@
+"""
+Build passes that run over the finished output tree before it is written
+"""
+from scute.internal.command import Command, function_references, inner_command
+from scute.internal.output_tree import OutputTree
+
+
+def _function_location(path: str) -> str | None:
+    # "data/ns/functions/a/b.mcfunction" -> "ns:a/b"
+    parts = path.split("/", 3)
+    if (
+        len(parts) == 4
+        and parts[0] == "data"
+        and parts[2] == "functions"
+        and parts[3].endswith(".mcfunction")
+    ):
+        return f"{parts[1]}:{parts[3][: -len('.mcfunction')]}"
+    return None
+
+
+def rename_function_references(tree: OutputTree, renames: dict[str, str]):
+    """
+    Rewrites every reference to a function in function files and function tags. Renamed commands and tags are
+    replaced with copies, so commands shared with another tree (like the one a build was copied from) are unchanged
+    Args:
+        tree: The output tree
+        renames: A dict of old resource locations to new ones, like {"ns:old": "ns:new"}
+    """
+    for path, file in tree.files.items():
+        if file.is_json:
+            if "/tags/functions/" in path:
+                file.content = {
+                    **file.content,
+                    "values": [
+                        renames.get(value, value) for value in file.content["values"]
+                    ],
+                }
+        elif path.endswith(".mcfunction"):
+            file.content = [
+                _rename_in_command(command, renames) for command in file.content
+            ]
+
+
+def _rename_in_command(command: Command, renames: dict[str, str]) -> Command:
+    # Function references are `function <location> ...`, `schedule function <location> ...`,
+    # or either of those after `execute ... run` or `return run`. Returns the command itself if nothing was renamed
+    args = command.args
+    inner = inner_command(command)
+    if inner is not None:
+        renamed = _rename_in_command(inner, renames)
+        if renamed is inner:
+            return command
+        return Command(command.kind, args[:-1] + [renamed], command.macro)
+    if command.kind == "function" and args and args[0] in renames:
+        return Command("function", [renames[args[0]]] + args[1:], command.macro)
+    if (
+        command.kind == "schedule"
+        and len(args) > 1
+        and args[0] == "function"
+        and args[1] in renames
+    ):
+        return Command(
+            "schedule", [args[0], renames[args[1]]] + args[2:], command.macro
+        )
+    return command
+
+
+def tree_references(tree: OutputTree):
+    """
+    Yields (path, location, scheduled) for every function reference in the tree's functions and function tags
+    """
+    for path, file in tree.files.items():
+        if file.is_json:
+            if "/tags/functions/" in path:
+                for value in file.content["values"]:
+                    if isinstance(value, str) and not value.startswith("#"):
+                        yield path, value, False
+        elif path.endswith(".mcfunction"):
+            for command in file.content:
+                for location, scheduled in function_references(command):
+                    yield path, location, scheduled
+
+
+def deduplicate_functions(tree: OutputTree) -> int:
+    """
+    Keeps a single copy of functions with identical bodies, and points every reference at it.
+    Only anonymous functions are removed, and this is repeated until no more duplicates appear,
+    as rewriting references can make the functions calling them identical too. Functions that are scheduled are left
+    alone, as scheduling a function replaces the pending run of the same function
+    Returns:
+        The number of functions removed
+    """
+    scheduled = {
+        location for _, location, is_scheduled in tree_references(tree) if is_scheduled
+    }
+    removed = 0
+    while True:
+        bodies: dict[str, list[str]] = {}
+        for path, file in tree.files.items():
+            if (
+                not file.is_json
+                and path.endswith(".mcfunction")
+                and _function_location(path) not in scheduled
+            ):
+                bodies.setdefault(file.render(), []).append(path)
+
+        renames = {}
+        for paths in bodies.values():
+            if len(paths) < 2:
+                continue
+            # Prefer keeping a named function, otherwise keep the first in sorted order so the result is stable
+            paths.sort(key=lambda p: (tree.files[p].generated, p))
+            keep = _function_location(paths[0])
+            for path in paths[1:]:
+                if tree.files[path].generated:
+                    renames[_function_location(path)] = keep
+                    del tree.files[path]
+
+        if not renames:
+            return removed
+        removed += len(renames)
+        rename_function_references(tree, renames)
+
+
+def _base36(number: int) -> str:
+    text = ""
+    while True:
+        number, digit = divmod(number, 36)
+        text = "0123456789abcdefghijklmnopqrstuvwxyz"[digit] + text
+        if not number:
+            return text
+
+
+def shorten_function_names(
+    tree: OutputTree, hashed: bool = False, min_length: int = 6
+) -> dict[str, str]:
+    """
+    Gives every anonymous function a short name, and points every reference at it. Names are counted up in base 36
+    ("0", "1", ... "z", "10", ...) in the order the functions were created, or with hashed, they're the shortest
+    prefix of their current name that no other function starts with, so they stay the same when other functions change.
+    Names of functions that aren't anonymous are never reused
+    Args:
+        tree: The output tree
+        hashed: Whether the current names are hashes, like the ones from deterministic names
+        min_length: The shortest prefix used when hashed
+    Returns:
+        A dict of old resource locations to new ones
+    """
+    from os.path import commonprefix
+
+    generated = {}
+    taken = set()
+    for path, file in tree.files.items():
+        location = _function_location(path)
+        if location is None or file.is_json:
+            continue
+        if file.generated:
+            namespace, _, name = location.partition(":")
+            generated.setdefault(namespace, []).append(name)
+        else:
+            taken.add(location)
+
+    renames = {}
+    for namespace, names in generated.items():
+        if hashed:
+            names = sorted(names)
+            for i, name in enumerate(names):
+                # Longer than the part it shares with the names next to it in sorted order, so no other name has it
+                length = min_length
+                for neighbour in names[max(i - 1, 0) : i] + names[i + 1 : i + 2]:
+                    length = max(length, len(commonprefix([name, neighbour])) + 1)
+                while f"{namespace}:{name[:length]}" in taken and length < len(name):
+                    length += 1
+                if length < len(name):
+                    renames[f"{namespace}:{name}"] = f"{namespace}:{name[:length]}"
+        else:
+            counter = 0
+            for name in names:
+                while f"{namespace}:{_base36(counter)}" in taken:
+                    counter += 1
+                renames[f"{namespace}:{name}"] = f"{namespace}:{_base36(counter)}"
+                counter += 1
+
+    def path(location):
+        namespace, _, name = location.partition(":")
+        return f"data/{namespace}/functions/{name}.mcfunction"
+
+    moved = {path(old): path(new) for old, new in renames.items()}
+    tree.files = {moved.get(p, p): file for p, file in tree.files.items()}
+    rename_function_references(tree, renames)
+
+    # References the renaming can't reach, like ones inside raw commands, would be left pointing at nothing
+    for file_path, location, _ in tree_references(tree):
+        if location in renames:
+            raise RuntimeError(
+                f"{file_path} refers to {location} in a way that can't be renamed, so it can't be minified"
+            )
+    return renames
+
+
+def _score_write(command: Command | None) -> tuple | None:
+    # Returns (action, target, objective, value) for `scoreboard players set/add/remove/reset` commands that can be
+    # safely combined - not macros, and only for a single fixed score holder, as selectors like @r can change
+    if command is None or command.kind != "scoreboard" or command.macro:
+        return None
+    args = command.args
+    if len(args) < 4 or args[0] != "players":
+        return None
+    action, target, objective = args[1], str(args[2]), args[3]
+    if target.startswith("@") and target != "@s" or target == "*":
+        return None
+    if action == "reset" and len(args) == 4:
+        return action, target, objective, None
+    if action in ("set", "add", "remove") and len(args) == 5:
+        try:
+            return action, target, objective, int(str(args[4]))
+        except ValueError:
+            return None
+    return None
+
+
+def peephole_optimize(commands: list[Command]) -> list[Command]:
+    """
+    Simplifies consecutive writes to the same score in a function:
+    `set X obj 0` followed by `add X obj 5` becomes `set X obj 5`, and a write that's immediately overwritten by
+    a set or reset (like the back to back `set $success scute 0` that else_ emits) is dropped
+    Returns:
+        The new list of commands
+    """
+    out = []
+    for command in commands:
+        write = _score_write(command)
+        while write and out:
+            previous = _score_write(out[-1])
+            if previous is None or previous[1:3] != write[1:3]:
+                break
+            if write[0] in ("set", "reset"):
+                # The previous write is overwritten, so it can go
+                out.pop()
+            elif previous[0] == "set":
+                value = previous[3] + (write[3] if write[0] == "add" else -write[3])
+                # Scores are 32-bit, and wrap around like they do in the game
+                value = (value + 2**31) % 2**32 - 2**31
+                command = Command(
+                    "scoreboard", ["players", "set", write[1], write[2], value]
+                )
+                write = _score_write(command)
+                out.pop()
+            else:
+                break
+        out.append(command)
+    return out
+
+
+def optimize_functions(tree: OutputTree) -> int:
+    """
+    Runs the peephole optimizer over every function in the tree
+    Returns:
+        The number of commands removed
+    """
+    removed = 0
+    for path, file in tree.files.items():
+        if not file.is_json and path.endswith(".mcfunction"):
+            optimized = peephole_optimize(file.content)
+            removed += len(file.content) - len(optimized)
+            file.content = optimized
+    return removed
+
+
+def instrument_functions(
+    tree: OutputTree, objective: str, skip: set[str] = ()
+) -> list[str]:
+    """
+    Starts every function with a command adding 1 to its own score on the objective, named after its location
+    Args:
+        tree: The output tree
+        objective: The scoreboard the calls are counted on
+        skip: Locations of functions that shouldn't be counted
+    Returns:
+        The locations of the functions that were instrumented, in sorted order
+    """
+    locations = []
+    for path, file in tree.files.items():
+        location = _function_location(path)
+        if file.is_json or location is None or location in skip:
+            continue
+        file.content.insert(
+            0, Command("scoreboard", ["players", "add", location, objective, 1])
+        )
+        locations.append(location)
+    return sorted(locations)
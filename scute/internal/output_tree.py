@@ -0,0 +1,254 @@
+"""
+An in-memory tree of every file generated during a build, written to disk in one go at the end
+"""
+import os
+from os.path import join
+
+from scute.internal.command import render_function
+
+# Name of the file in the root of a built pack that records the hash of every file scute wrote there
+MANIFEST_NAME = ".scute_manifest.json"
+
+
+class OutputFile:
+    def __init__(self, content, is_json: bool = False, generated: bool = False):
+        """
+        A single generated file. Functions hold a list of commands, json files hold the data to be dumped
+        Args:
+            content: The list of `scute.internal.command.Command`s, or the json data
+            is_json: Whether the content should be serialised as json when written
+            generated: Whether this is an anonymous function, whose name nothing outside the pack relies on
+        """
+        self.content = content
+        self.is_json = is_json
+        self.generated = generated
+
+    def render(self, minify: bool = False) -> str:
+        """
+        Returns the text of the file
+        Args:
+            minify: Leaves out blank lines and comments from functions, and whitespace from json
+        """
+        if self.is_json:
+            import json
+
+            if minify:
+                return json.dumps(self.content, separators=(",", ":"))
+            return json.dumps(self.content, indent=4)
+        return render_function(self.content, minify)
+
+
+class OutputTree:
+    def __init__(self):
+        """
+        Collects every file of the pack in memory, keyed by its path relative to the root of the pack
+        (always with forward slashes, like "data/namespace/functions/name.mcfunction")
+        """
+        self.files: dict[str, OutputFile] = {}
+        # The files written since each recording started, see start_recording
+        self._recordings: list[dict[str, OutputFile | None]] = []
+
+    def append_commands(self, path: str, commands: list):
+        """
+        Appends commands to a function, creating it if it doesn't exist yet
+        """
+        if path in self.files:
+            self.files[path].content.extend(commands)
+            for recording in self._recordings:
+                # A file from before the recording started can't be replayed by itself
+                recording.setdefault(path, None)
+        else:
+            self._set(path, OutputFile(list(commands)))
+
+    def write_commands(self, path: str, commands: list, generated: bool = False):
+        """
+        Creates or replaces a function
+        """
+        self._set(path, OutputFile(list(commands), generated=generated))
+
+    def write_json(self, path: str, data):
+        """
+        Creates or replaces a json file
+        """
+        self._set(path, OutputFile(data, is_json=True))
+
+    def _set(self, path: str, file: OutputFile):
+        self.files[path] = file
+        for recording in self._recordings:
+            recording[path] = file
+
+    def add_files(self, files: dict[str, OutputFile]):
+        """
+        Writes copies of files, like the ones from `stop_recording`
+        """
+        for path, file in files.items():
+            self._set(
+                path,
+                OutputFile(
+                    file.content if file.is_json else list(file.content),
+                    file.is_json,
+                    file.generated,
+                ),
+            )
+
+    def start_recording(self):
+        """
+        Starts recording the files written to the tree, until the matching `stop_recording`. Recordings can be nested
+        """
+        self._recordings.append({})
+
+    def stop_recording(self) -> dict[str, OutputFile] | None:
+        """
+        Stops the latest recording
+        Returns:
+            A copy of every file written since it started, by path, or None if a file that already existed was
+            appended to, as replaying the recording wouldn't recreate that file
+        """
+        recording = self._recordings.pop()
+        if None in recording.values():
+            return None
+        return {
+            path: OutputFile(
+                file.content if file.is_json else list(file.content),
+                file.is_json,
+                file.generated,
+            )
+            for path, file in recording.items()
+        }
+
+    def get(self, path: str) -> OutputFile | None:
+        return self.files.get(path)
+
+    def clear(self):
+        self.files.clear()
+
+    def copy(self) -> "OutputTree":
+        """
+        Returns a copy of the tree that build passes can change without changing this one. Functions get their own
+        list of commands and json files their own top level dict, but the commands themselves are shared
+        """
+        tree = OutputTree()
+        for path, file in self.files.items():
+            content = file.content
+            tree.files[path] = OutputFile(
+                dict(content) if isinstance(content, dict) else list(content),
+                file.is_json,
+                file.generated,
+            )
+        return tree
+
+    def render(self, minify: bool = False) -> dict[str, str]:
+        """
+        Returns the text of every file, by its path
+        Args:
+            minify: Like `OutputFile.render`
+        """
+        return {path: file.render(minify) for path, file in self.files.items()}
+
+    def flush(
+        self, root: str, incremental: bool = True, rendered: dict[str, str] = None
+    ) -> tuple[int, int]:
+        """
+        Writes the tree to disk under root, creating each folder only once. When incremental, only files whose
+        content changed since the last build are rewritten, and only files that are no longer generated are deleted
+        Args:
+            root: The folder of the pack
+            incremental: Whether to compare against the manifest of the last build instead of rebuilding from scratch
+            rendered: The text of every file from `render`, if it's already been rendered
+        Returns:
+            The number of files written and the number of stale files deleted
+        """
+        # Imported here, so that importing scute stays fast
+        import hashlib
+        import json
+        import shutil
+
+        manifest_path = join(root, MANIFEST_NAME)
+        old_manifest = None
+        if incremental:
+            try:
+                with open(manifest_path) as f:
+                    old_manifest = json.load(f)
+            except (OSError, ValueError):
+                pass
+
+        # Without a manifest there's no way to tell which files are stale, so start from an empty folder
+        if old_manifest is None:
+            shutil.rmtree(root, ignore_errors=True)
+            old_manifest = {}
+
+        manifest = {}
+        folders = {}
+        if rendered is None:
+            rendered = self.render()
+        for path, content in rendered.items():
+            digest = hashlib.sha1(content.encode()).hexdigest()
+            manifest[path] = digest
+            folder, _, name = path.rpartition("/")
+            if old_manifest.get(path) != digest or not os.path.isfile(
+                _disk_path(root, path)
+            ):
+                folders.setdefault(folder, []).append((name, content))
+
+        written = 0
+        for folder, files in folders.items():
+            folder_path = _disk_path(root, folder)
+            os.makedirs(folder_path, exist_ok=True)
+            for name, content in files:
+                with open(join(folder_path, name), "w") as f:
+                    f.write(content)
+                written += 1
+
+        removed = 0
+        for path in old_manifest.keys() - manifest.keys():
+            try:
+                os.remove(_disk_path(root, path))
+                removed += 1
+            except OSError:
+                pass
+            _remove_empty_folders(root, path.rpartition("/")[0])
+
+        os.makedirs(root, exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+        return written, removed
+
+    def flush_zip(
+        self, zip_path: str, compression_level: int = 6, rendered: dict[str, str] = None
+    ):
+        """
+        Writes every file in the tree straight into a zip archive, without touching the folder structure on disk
+        Args:
+            zip_path: The path of the archive to create or overwrite
+            compression_level: From 0 (stored, no compression) to 9 (smallest archive)
+            rendered: The text of every file from `render`, if it's already been rendered
+        """
+        import zipfile
+
+        if compression_level == 0:
+            compression = zipfile.ZIP_STORED
+        else:
+            compression = zipfile.ZIP_DEFLATED
+
+        with zipfile.ZipFile(
+            zip_path, "w", compression=compression, compresslevel=compression_level
+        ) as archive:
+            if rendered is None:
+                rendered = self.render()
+            for path, content in rendered.items():
+                archive.writestr(path, content)
+
+
+def _disk_path(root: str, path: str) -> str:
+    return join(root, *path.split("/")) if path else root
+
+
+def _remove_empty_folders(root: str, folder: str):
+    # Walks up from the folder of a deleted file, removing folders until one still has something in it
+    while folder:
+        try:
+            os.rmdir(_disk_path(root, folder))
+        except OSError:
+            return
+        folder = folder.rpartition("/")[0]
@@ -0,0 +1,127 @@
+"""
+An opt-in profiler that records where build time goes, enabled with `scute.pack.set_profiling`
+"""
+import json
+import sys
+import time
+
+from scute.internal.utils import format_text
+
+
+def caller_source() -> tuple[str, int]:
+    """
+    Returns the module and line of the first frame on the stack that isn't inside scute
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != "scute" and not module.startswith("scute."):
+            return module, frame.f_lineno
+        frame = frame.f_back
+    return "<unknown>", 0
+
+
+class BuildProfiler:
+    def __init__(self):
+        """
+        Collects one entry per function, recipe and tag created during the build
+        """
+        self.entries: list[dict] = []
+        # Where each function tag was first added to, as they're only created at the end of the build
+        self.tag_sources: dict[str, tuple[str, int]] = {}
+        # Time spent in nested timers, one total per timer that's currently running
+        self._children: list[float] = []
+
+    def start(self) -> float:
+        self._children.append(0.0)
+        return time.perf_counter()
+
+    def stop(self, start: float) -> float:
+        """
+        Stops a timer started with start()
+        Returns:
+            The time spent, excluding time spent in timers nested inside it (like functions generated by this function)
+        """
+        total = time.perf_counter() - start
+        nested = self._children.pop()
+        if self._children:
+            self._children[-1] += total
+        return total - nested
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        seconds: float,
+        commands: int,
+        size: int,
+        source: tuple[str, int],
+    ):
+        """
+        Records one generated function, recipe or tag
+        Args:
+            kind: "function", "recipe" or "tag"
+            name: The resource location
+            seconds: Wall time spent generating it
+            commands: The number of commands it contains
+            size: The number of bytes written for it
+            source: The python module and line that produced it
+        """
+        self.entries.append(
+            {
+                "kind": kind,
+                "name": name,
+                "seconds": seconds,
+                "commands": commands,
+                "bytes": size,
+                "module": source[0],
+                "line": source[1],
+            }
+        )
+
+    def report(self, path: str, top: int = 15, stages: dict[str, float] = None):
+        """
+        Writes every entry to a json file, and prints the slowest entries and modules
+        Args:
+            path: The path of the json report
+            top: How many entries to print
+            stages: The seconds each stage of the build took
+        """
+        modules = {}
+        for entry in self.entries:
+            module = modules.setdefault(
+                entry["module"], {"seconds": 0.0, "commands": 0, "bytes": 0, "count": 0}
+            )
+            module["seconds"] += entry["seconds"]
+            module["commands"] += entry["commands"]
+            module["bytes"] += entry["bytes"]
+            module["count"] += 1
+
+        with open(path, "w") as f:
+            json.dump(
+                {"entries": self.entries, "modules": modules, "stages": stages or {}},
+                f,
+                indent=4,
+            )
+
+        print(format_text(f"Build profile ({len(self.entries)} entries):", 36))
+        for entry in sorted(self.entries, key=lambda e: e["seconds"], reverse=True)[
+            :top
+        ]:
+            print(
+                f"  {entry['seconds'] * 1000:9.2f}ms {entry['commands']:6} commands {entry['bytes']:8} bytes"
+                f"  {entry['kind']} {entry['name']} ({entry['module']}:{entry['line']})"
+            )
+        print(format_text("By module:", 36))
+        for name, module in sorted(
+            modules.items(), key=lambda m: m[1]["seconds"], reverse=True
+        ):
+            print(
+                f"  {module['seconds'] * 1000:9.2f}ms {module['commands']:6} commands {module['bytes']:8} bytes"
+                f"  {name} ({module['count']} entries)"
+            )
+        if stages:
+            print(format_text("By build stage:", 36))
+            for stage, seconds in stages.items():
+                print(f"  {seconds * 1000:9.2f}ms  {stage}")
+        print(format_text(f"Full profile written to {path}", 36))
@@ -0,0 +1,77 @@
+"""
+The ids of items, blocks, biomes and enchantments, loaded from scute/data/registries.json the first time they're used.
+
+Each registry has its ids for one or more Minecraft versions. A version is either a space-separated string of every id,
+or {"base": "<version>", "add": "<ids>", "remove": "<ids>"} listing the changes from another version.
+"""
+from os.path import dirname, join
+
+_PATH = join(dirname(dirname(__file__)), "data", "registries.json")
+_data = None
+# (registry, version): frozenset of ids
+_ids = {}
+
+
+def _load() -> dict:
+    global _data
+    if _data is None:
+        import json
+
+        with open(_PATH) as f:
+            _data = json.load(f)
+    return _data
+
+
+def ids(registry: str, version: str = None) -> frozenset[str]:
+    """
+    Returns every id in a registry, without the minecraft: namespace
+    Args:
+        registry: "item", "block", "biome" or "enchantment"
+        version: A Minecraft version like "1.20.1", defaults to the latest one known
+    """
+    data = _load()
+    version = version or data["latest"]
+    key = (registry, version)
+    if key not in _ids:
+        versions = data["registries"][registry]
+        if version not in versions:
+            raise ValueError(
+                f"No {registry} ids for version {version}, only for {', '.join(versions)}"
+            )
+        entry = versions[version]
+        if isinstance(entry, str):
+            _ids[key] = frozenset(entry.split())
+        else:
+            _ids[key] = (
+                ids(registry, entry["base"]) | set(entry.get("add", "").split())
+            ) - set(entry.get("remove", "").split())
+    return _ids[key]
+
+
+class RegistryEnum(type):
+    """
+    A metaclass for classes like `scute.items.Item`, which have an attribute for every id in their registry
+    (`Item.diamond == "diamond"`), without defining them all when the module is imported
+    """
+
+    _registry: str
+
+    def __getattr__(cls, name: str) -> str:
+        # Only called for attributes the class doesn't have
+        if not name.startswith("_") and name in ids(cls._registry):
+            return name
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+    def __contains__(cls, id: str) -> bool:
+        if id.startswith("minecraft:"):
+            id = id[len("minecraft:") :]
+        return id in ids(cls._registry)
+
+    def __dir__(cls):
+        return sorted(set(super().__dir__()) | ids(cls._registry))
+
+    def ids(cls, version: str = None) -> frozenset[str]:
+        """
+        Returns every id of this type, for a Minecraft version like "1.20.1" or the latest one known
+        """
+        return ids(cls._registry, version)
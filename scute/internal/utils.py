@@ -1,27 +1,56 @@
-import json
-import os
-from os.path import join
-
 from scute import pack
+from scute.internal.command import Branch, Command, render_function
 
 
 def create_json_file(namespace, name, p, data):
-    path = join(pack.path, pack.name)
-    path = join(path, rf"data\{namespace}\{p}")
+    pack._output.write_json(f"data/{namespace}/{p}/{name}.json", data)
+
+
+def create_function(namespace, name, commands: list[Command]):
+    # Appends if the function already exists, which is used by else_ to patch finished functions
+    _close_branches(commands)
+    pack._output.append_commands(function_path(namespace, name), commands)
+
+
+def function_path(namespace, name) -> str:
+    return f"data/{namespace}/functions/{name}.mcfunction"
+
+
+def anonymous_name(namespace, commands: list[Command]) -> str:
+    """
+    Returns a name for an anonymous function - random, or a hash of its namespace and body if deterministic names are on
+    or the pack is being built
+    """
+    if pack.deterministic_names or pack._hashed_names:
+        # Imported here, so that importing scute stays fast
+        import hashlib
 
-    os.makedirs(path, exist_ok=True)
+        body = namespace + "\n" + render_function(commands)
+        return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+    from uuid import uuid4
 
-    with open(join(path, name + ".json"), "w") as f:
-        json.dump(data, f, indent=4)
+    return str(uuid4())
 
 
-def create_function(namespace, name, lines: list[str]):
-    bp = join(pack.path, pack.name, rf"data\{namespace}\functions")
+def create_anonymous_function(namespace, commands: list[Command]) -> str:
+    """
+    Creates a function with a generated name, and returns that name
+    """
+    _close_branches(commands)
+    name = anonymous_name(namespace, commands)
+    # With deterministic names, an existing file of the same name already has the same body, so it's replaced, not appended to
+    pack._output.write_commands(
+        function_path(namespace, name), commands, generated=True
+    )
+    return name
 
-    os.makedirs(bp, exist_ok=True)
 
-    with open(join(bp, rf"{name}.mcfunction"), "a") as f:
-        f.writelines(lines)
+def _close_branches(commands: list[Command]):
+    # If/else chains stay open while the function they're in is being built, and get their own function once it's done
+    for command in commands:
+        if isinstance(command, Branch) and command.args[0] is None:
+            name = create_anonymous_function(pack.namespace, command.branches)
+            command.args[0] = f"{pack.namespace}:{name}"
 
 
 def format_text(text, *codes):
@@ -1,11 +1,10 @@
 """
 Submodule for json-formatted text, used in /tellraw or item names etc
 """
-import json
 from scute.internal.dict_to_NBT import dict_to_NBT
 
-from typing import TYPE_CHECKING
-
+# Only true for type checkers, as importing typing is slow
+TYPE_CHECKING = False
 if TYPE_CHECKING:
     from scute.items import Item
 
@@ -143,4 +142,6 @@ class _JsonText:
         self.text = text
 
     def __str__(self):
+        import json
+
         return json.dumps(self.text)
@@ -1,15 +1,32 @@
 """
 Submodule for creating and managing recipes - shaped crafting, smelting, etc.
 """
+import json
 from typing import TypeVar
 
+from scute import pack
+from scute.internal.profiler import caller_source
 from scute.internal.utils import create_json_file, format_text
 from scute.tags import ItemTag
 
 
 class Recipe:
     def register(self, namespace: str, name: str):
-        create_json_file(namespace, name, r"recipes", self.json)
+        profiler = pack._profiler
+        if profiler:
+            start = profiler.start()
+
+        create_json_file(namespace, name, "recipes", self.json)
+
+        if profiler:
+            profiler.record(
+                "recipe",
+                f"{namespace}:{name}",
+                profiler.stop(start),
+                0,
+                len(json.dumps(self.json, indent=4).encode()),
+                caller_source(),
+            )
         print(format_text(f"Created recipe {namespace}:{name}", 32))
 
 
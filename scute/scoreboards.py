@@ -1,14 +1,11 @@
 """
 Submodule for scoreboards and criteria
 """
-from scute.tags import _tags, _scute_init
 from scute import pack
-from scute.commands import _command
+from scute.commands import _command, _forks, _functionArgument, functionArg
 from scute.json_text import _JsonText
-from scute.internal.utils import create_function
-import atexit
-
-_scoreboard_list = []
+from scute.internal.command import Command, nested_commands
+from scute.internal.utils import create_anonymous_function
 
 
 class Scoreboard:
@@ -32,22 +29,22 @@ class Scoreboard:
         self.display = displayName
         self.slot = displaySlot
 
-        _scoreboard_list.append(self)
+        pack._scoreboard_list.append(self)
 
         load = "minecraft:load"
         init = pack.namespace + ":scute_init"
 
-        if load not in _tags:
-            _tags[load] = [init]
-        elif init not in _tags[load]:
-            _tags[load].append(init)
+        if load not in pack._tags:
+            pack._tags[load] = [init]
+        elif init not in pack._tags[load]:
+            pack._tags[load].append(init)
 
     @_command
     def delete(self):
         """
         Deletes the scoreboard and all its data
         """
-        return f"scoreboard objectives remove {self.name}"
+        return Command("scoreboard", ["objectives", "remove", self.name])
 
     @_command
     def set_display(self, slot: str):
@@ -56,7 +53,7 @@ class Scoreboard:
         Args:
             slot: The display slot, like `scute.scoreboards.DisplaySlots.sidebar`
         """
-        return f"scoreboard objectives setdisplay {slot} {self.name}"
+        return Command("scoreboard", ["objectives", "setdisplay", slot, self.name])
 
     @_command
     def get(self, target: str):
@@ -65,7 +62,7 @@ class Scoreboard:
         Args:
             target: The target(s), like "@s"
         """
-        return f"scoreboard players get {target} {self.name}"
+        return Command("scoreboard", ["players", "get", target, self.name])
 
     @_command
     def set(self, target: str, value: int):
@@ -75,7 +72,7 @@ class Scoreboard:
             target: The target(s), like "@s"
             value: The new value
         """
-        return f"scoreboard players set {target} {self.name} {value}"
+        return Command("scoreboard", ["players", "set", target, self.name, value])
 
     @_command
     def add(self, target: str, value: int):
@@ -85,7 +82,7 @@ class Scoreboard:
             target: The target(s), like "@s"
             value: The value for the score to be incremented by
         """
-        return f"scoreboard players add {target} {self.name} {value}"
+        return Command("scoreboard", ["players", "add", target, self.name, value])
 
     @_command
     def remove(self, target: str, value: int):
@@ -95,7 +92,7 @@ class Scoreboard:
             target: The target(s), like "@s"
             value: The value for the score to be decremented by
         """
-        return f"scoreboard players remove {target} {self.name} {value}"
+        return Command("scoreboard", ["players", "remove", target, self.name, value])
 
     @_command
     def reset(self, target: str):
@@ -104,7 +101,7 @@ class Scoreboard:
         Args:
             target: The target(s), like "@s"
         """
-        return f"scoreboard players reset {target} {self.name}"
+        return Command("scoreboard", ["players", "reset", target, self.name])
 
     @_command
     def enable(self, target: str):
@@ -113,7 +110,7 @@ class Scoreboard:
         Args:
             target: The target(s), like "@s"
         """
-        return f"scoreboard players enable {target} {self.name}"
+        return Command("scoreboard", ["players", "enable", target, self.name])
 
     @_command
     def operation_as_source(
@@ -127,7 +124,18 @@ class Scoreboard:
             target_scoreboard: The scoreboard which the value is put into
             target_target: The target from the source scoreboard to put the value into
         """
-        return f"scoreboard players operation {target_target} {target_scoreboard.name} {operation} {self.name} {source_target}"
+        return Command(
+            "scoreboard",
+            [
+                "players",
+                "operation",
+                target_target,
+                target_scoreboard.name,
+                operation,
+                self.name,
+                source_target,
+            ],
+        )
 
     @_command
     def operation_as_target(
@@ -141,23 +149,235 @@ class Scoreboard:
             operation: The operation, like TODO
             target_target: The target from this scoreboard that the value is put into
         """
-        return f"scoreboard players operation {target_target} {self.name} {operation} {source_scoreboard.name} {source_target}"
-
-
-def _register_scoreboards():
+        return Command(
+            "scoreboard",
+            [
+                "players",
+                "operation",
+                target_target,
+                self.name,
+                operation,
+                source_scoreboard.name,
+                source_target,
+            ],
+        )
+
+    def switch(
+        self,
+        target: str,
+        cases: dict[int | range | tuple, functionArg],
+        default: functionArg = None,
+    ) -> Command:
+        """
+        Runs the case matching the score of a target. The cases are compiled to a balanced tree of functions, so only
+        about log2(number of cases) commands are run to find the right one, instead of one per case
+        Args:
+            target: The target whose score is checked, like "@s" or "$state"
+            cases: A dict of values to the function, command, or list of commands to run. Values can be a single
+                number, a `range` (with a step of 1), or an inclusive (min, max) tuple where None is unbounded,
+                like {0: give(...), range(1, 5): my_func, (5, None): [...]}
+            default: Run if no case matches the score
+        Returns:
+            The command calling the tree, which is added to the current function
+        """
+        command = _dispatch(target, self.name, cases, default)
+        if command is not None:
+            pack._command_stack.append(command)
+        return command
+
+
+def _case_range(value) -> tuple[float, float]:
+    # The inclusive bounds of a switch case, with infinity for unbounded ends
+    if isinstance(value, int):
+        return value, value
+    if isinstance(value, range):
+        if value.step != 1 or not value:
+            raise ValueError(
+                f"Switch case ranges must be non-empty with a step of 1, not {value}"
+            )
+        return value.start, value.stop - 1
+    if isinstance(value, tuple) and len(value) == 2:
+        low, high = value
+        return (
+            float("-inf") if low is None else low,
+            float("inf") if high is None else high,
+        )
+    raise ValueError(f"Invalid switch case {value!r}")
+
+
+def _dispatch(
+    target: str, objective: str, cases: dict, default: functionArg = None
+) -> Command | None:
+    """
+    Compiles the cases of a switch to a tree of functions, and returns the command that calls it
+    Args:
+        target: The score holder that's checked
+        objective: The name of the scoreboard
+        cases: A dict of case values to what to run, like in `Scoreboard.switch`
+        default: What to run if no case matches
+    """
+    # Every number is covered by exactly one leaf - the cases, and the gaps between them, which run the default
+    leaves = []
+    for value, cmd in cases.items():
+        low, high = _case_range(value)
+        leaves.append((low, high, _functionArgument(cmd, True)))
+    leaves.sort(key=lambda leaf: leaf[0])
+
+    default_command = _functionArgument(default, True) if default is not None else None
+    filled = []
+    low = float("-inf")
+    for leaf in leaves:
+        if leaf[0] < low:
+            raise ValueError(f"Switch cases overlap at {leaf[0]}")
+        if leaf[0] > low:
+            filled.append((low, leaf[0] - 1, default_command))
+        filled.append(leaf)
+        low = leaf[1] + 1
+    if low != float("inf"):
+        filled.append((low, float("inf"), default_command))
+
+    # Neighbouring leaves that run the same command are checked together
+    merged = []
+    for leaf in filled:
+        if merged and merged[-1][2] is leaf[2]:
+            merged[-1] = (merged[-1][0], leaf[1], leaf[2])
+        else:
+            merged.append(leaf)
+
+    commands = _dispatch_node(target, objective, merged)
+    if not commands:
+        return None
+    if len(commands) == 1 and commands[0].kind != "return":
+        return commands[0]
+    return _call(commands)
+
+
+def _call(commands: list[Command]) -> Command:
+    name = create_anonymous_function(pack.namespace, commands)
+    return Command("function", [f"{pack.namespace}:{name}"])
+
+
+def _matches(low: float, high: float) -> str:
+    if low == high:
+        return str(low)
+    return (
+        f"{'' if low == float('-inf') else low}..{'' if high == float('inf') else high}"
+    )
+
+
+def _dispatch_node(target: str, objective: str, leaves: list) -> list[Command]:
+    # The score is already known to be within the leaves' range here, so each node only has to check which half it's
+    # in. Leaves without a command (gaps when there's no default) are never checked for
+    def guard(low: float, high: float, run: Command) -> Command:
+        return Command(
+            "execute",
+            [
+                "if",
+                "score",
+                target,
+                objective,
+                "matches",
+                _matches(low, high),
+                "run",
+                run,
+            ],
+        )
+
+    real = [leaf for leaf in leaves if leaf[2] is not None]
+    if not real:
+        return []
+    if len(real) == 1:
+        if len(leaves) == 1:
+            return [real[0][2]]
+        return [guard(*real[0])]
+
+    middle = len(leaves) // 2
+    left, right = leaves[:middle], leaves[middle:]
+
+    def wrap(commands: list[Command]) -> Command:
+        # Commands that return get a function of their own, so that they don't return from this one
+        if len(commands) == 1 and not any(
+            command.kind == "return" for command in nested_commands(commands[0])
+        ):
+            return commands[0]
+        return _call(commands)
+
+    def is_guard(command: Command) -> bool:
+        return command.kind == "execute" and command.args[:5] == [
+            "if",
+            "score",
+            target,
+            objective,
+            "matches",
+        ]
+
+    def check(half, commands: list[Command]) -> list[Command]:
+        if not commands:
+            return []
+        if len(half) > 1 and sum(leaf[2] is not None for leaf in half) == 1:
+            # A single case, which already checks its own range
+            return commands
+        if len(half) > 1 and len(commands) == 1 and is_guard(commands[0]):
+            # A single check of a narrower range, from a half of this half
+            return commands
+        # Gaps at the ends don't run anything, so they're left out of the range
+        real = [leaf for leaf in half if leaf[2] is not None]
+        return [guard(real[0][0], real[-1][1], wrap(commands))]
+
+    left_commands = _dispatch_node(target, objective, left)
+    right_commands = _dispatch_node(target, objective, right)
+    if pack.branch_mode == "return" and left_commands:
+        left_call = wrap(left_commands)
+        # Returning from a command run for several entities would skip the rest of them, so those are checked like
+        # in the "scoreboard" mode
+        if not any(_forks(command) for command in nested_commands(left_call)):
+            # The right half is checked in this function too, only reached if the left guard didn't return. A left
+            # half that's already a single check returns from that check, instead of being checked again, and gaps at
+            # the ends of the left half are left out of its range
+            if is_guard(left_call):
+                returned = Command(
+                    "execute",
+                    left_call.args[:-1] + [Command("return", ["run", left_call.run])],
+                )
+            else:
+                left_real = [leaf for leaf in left if leaf[2] is not None]
+                returned = guard(
+                    left_real[0][0],
+                    left_real[-1][1],
+                    Command("return", ["run", left_call]),
+                )
+            # Scores in the gaps the left check skipped reach the right half, so it has to check its range
+            if returned.args[5] != _matches(left[0][0], left[-1][1]) and not all(
+                is_guard(command) for command in right_commands
+            ):
+                right_commands = check(right, right_commands)
+            return [returned] + right_commands
+    return check(left, left_commands) + check(right, right_commands)
+
+
+def _scoreboard_commands() -> list[Command]:
+    # The commands creating every scoreboard, which go in scute_init
     function = [
-        f"scoreboard objectives add {scoreboard.name} {scoreboard.criteria} {scoreboard.display}"
-        for scoreboard in _scoreboard_list
+        Command(
+            "scoreboard",
+            [
+                "objectives",
+                "add",
+                scoreboard.name,
+                scoreboard.criteria,
+                scoreboard.display,
+            ],
+        )
+        for scoreboard in pack._scoreboard_list
     ]
     function += [
-        f"scoreboard objectives setdisplay {scoreboard.slot} {scoreboard.name}"
-        for scoreboard in _scoreboard_list
+        Command(
+            "scoreboard", ["objectives", "setdisplay", scoreboard.slot, scoreboard.name]
+        )
+        for scoreboard in pack._scoreboard_list
         if scoreboard.slot
     ]
-    _scute_init["commands"].extend(function)
-
-
-atexit.register(_register_scoreboards)
+    return function
 
 
 class Criteria:
@@ -0,0 +1,242 @@
+"""
+A build server, which keeps scute loaded between builds. Every build is a fresh `python mypack.py` process otherwise,
+which imports scute, loads the registries and fills the nbt caches all over again.
+
+    python -m scute serve --port 8377
+    python -m scute build pack_one.py pack_two.py --port 8377
+
+Each build gets its own `scute.Pack`, and the pack's script is run as `__main__` like it would be from the command
+line. Relative build paths are in the folder `scute build` was run from, including those of packs the script creates
+itself. Scripts share the interpreter's modules, path and arguments, so only one script runs at a time - builds only
+overlap when writing packs that are built after their script ends. The modules a script imports (besides scute, the
+standard library and installed packages) are imported again by the next script, so that changes to them are picked up
+and scripts in different folders get their own.
+
+The protocol is one line of json per message, so other tools can send builds too. Requests are
+`{"script": "path/to/pack.py", "cwd": "path/to/folder"}`, and each gets a response like
+`{"script": ..., "ok": true, "time": 0.25, "output": "what the build printed"}`.
+"""
+import asyncio
+import contextvars
+import io
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from os.path import abspath, dirname, join
+
+from scute import Pack, _current, _pack_defaults
+
+DEFAULT_PORT = 8377
+
+# What each build prints is collected separately, as they all share sys.stdout
+_build_output = contextvars.ContextVar("scute_build_output", default=None)
+
+
+class _ContextOutput(io.TextIOBase):
+    # Sends writes to the output of the build running in the current context, if there is one
+    def __init__(self, fallback):
+        self.fallback = fallback
+
+    def write(self, text: str) -> int:
+        return (_build_output.get() or self.fallback).write(text)
+
+    def flush(self):
+        self.fallback.flush()
+
+
+# Scripts share sys.modules, sys.path and sys.argv, so only one runs at a time. Packs built after their script has run
+# are built outside of the lock
+_script_lock = threading.Lock()
+# The modules imported by scripts so far, which are imported again by the next script
+_script_modules = set()
+
+
+def _is_library(name: str, module) -> bool:
+    # Modules from scute, the standard library and installed packages are the same for every script, so they're kept
+    file = getattr(module, "__file__", None)
+    return (
+        name == "scute"
+        or name.startswith("scute.")
+        or name.partition(".")[0] in sys.stdlib_module_names
+        or not file
+        or "site-packages" in file
+    )
+
+
+def _purge_modules(folder: str):
+    # Removes the modules imported from the script's folder or by earlier scripts, so that the script imports its own
+    # modules again - `helpers` from another folder isn't this script's `helpers`
+    folder = folder.rstrip(os.sep) + os.sep
+    for name, module in list(sys.modules.items()):
+        if _is_library(name, module):
+            continue
+        if name in _script_modules or abspath(module.__file__).startswith(folder):
+            del sys.modules[name]
+    _script_modules.clear()
+
+
+def _run_script(script: str):
+    # Runs a script as `__main__`, like `python script.py` would
+    import runpy
+
+    folder = dirname(script)
+    with _script_lock:
+        _purge_modules(folder)
+        before = set(sys.modules)
+        path, argv = list(sys.path), sys.argv
+        sys.path.insert(0, folder)
+        sys.argv = [script]
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise
+        finally:
+            sys.path[:], sys.argv = path, argv
+            _script_modules.update(
+                name
+                for name in set(sys.modules) - before
+                if not _is_library(name, sys.modules[name])
+            )
+
+
+def build_script(script: str, cwd: str = None, function_cache=None) -> dict:
+    """
+    Runs a pack's script and builds the pack, in a new `scute.Pack`. Meant to be run in a context of its own, like
+    with `contextvars.copy_context().run`
+    Args:
+        script: The path of the script
+        cwd: The folder relative paths are in, defaults to the working directory
+        function_cache: Reuses what functions created in earlier builds, like `scute.watch` does
+    Returns:
+        The response sent for the build - whether it worked, how long it took, and what it printed
+    """
+    import time
+    import traceback
+
+    cwd = cwd or os.getcwd()
+    script = abspath(join(cwd, script))
+
+    output = io.StringIO()
+    _build_output.set(output)
+    defaults = _pack_defaults.set({"root": cwd, "function_cache": function_cache})
+    pack = Pack()
+    token = _current.set(pack)
+    start = time.perf_counter()
+    ok = True
+    try:
+        _run_script(script)
+        if pack.name and pack.path and not pack._built:
+            pack.build()
+    except BaseException:
+        traceback.print_exc(file=output)
+        ok = False
+    finally:
+        _current.reset(token)
+        _pack_defaults.reset(defaults)
+
+    return {
+        "script": script,
+        "ok": ok,
+        "time": round(time.perf_counter() - start, 4),
+        "output": output.getvalue(),
+    }
+
+
+def _warm_up():
+    # Everything a typical pack needs, loaded once for every build
+    from scute.internal import registry
+    import scute.commands
+    import scute.function
+    import scute.items
+    import scute.blocks
+    import scute.scoreboards
+    import scute.tags
+
+    for name in ("item", "block", "biome", "enchantment"):
+        registry.ids(name)
+
+
+class BuildServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, jobs=None):
+        """
+        Builds packs sent to it over a socket, until it's stopped
+        Args:
+            host: The address to listen on - only this machine by default
+            port: The port to listen on
+            jobs: How many builds are taken at once, defaults to the number of cpus - their scripts still run one at
+                a time
+        """
+        self.host = host
+        self.port = port
+        self.executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        self.builds = 0
+
+    async def build(self, script: str, cwd: str = None) -> dict:
+        """
+        Builds a pack on one of the server's threads
+        """
+        context = contextvars.copy_context()
+        result = await asyncio.get_running_loop().run_in_executor(
+            self.executor, context.run, build_script, script, cwd
+        )
+        self.builds += 1
+        return result
+
+    async def _handle(self, reader, writer):
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    response = await self.build(request["script"], request.get("cwd"))
+                except (ValueError, KeyError, TypeError) as e:
+                    response = {"ok": False, "output": f"Invalid request: {e}\n"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        """
+        Listens for builds until the task is cancelled
+        """
+        from scute.internal.utils import format_text
+
+        _warm_up()
+        sys.stdout = _ContextOutput(sys.stdout)
+        server = await asyncio.start_server(self._handle, self.host, self.port)
+        print(format_text(f"Serving builds on {self.host}:{self.port}", 32))
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sys.stdout = sys.stdout.fallback
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def request_builds(
+    scripts: list[str], host: str = "127.0.0.1", port: int = DEFAULT_PORT
+) -> list[dict]:
+    """
+    Sends scripts to a build server, and waits for all of them to be built
+    Args:
+        scripts: The paths of the scripts, relative to the working directory
+        host: The address of the server
+        port: The port of the server
+    Returns:
+        The server's response for each script
+    """
+
+    async def send(script):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            request = {"script": script, "cwd": os.getcwd()}
+            writer.write(json.dumps(request).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+        finally:
+            writer.close()
+
+    return await asyncio.gather(*[send(script) for script in scripts])
@@ -1,50 +1,49 @@
 """
 Submodule for creating and managing tags - function tags, block tags, item tags, etc.
 """
-import atexit
-
-from scute import _function_namespaces, pack
-from scute.internal.utils import create_json_file, format_text, create_function
-
-# Dict of function tags, {"namespace:mytag": ["namespace:function", ...]}
-_tags = {}
-_scute_init = {"commands": [], "scoreboard_needed": False}
-
-
-def _create_function_tag_files():
-    if _scute_init["commands"]:
-        namespace = pack.namespace + ":scute_init"
-
-        if "minecraft:load" in _tags:
-            _tags["minecraft:load"].append(namespace)
-        else:
-            _tags["minecraft:load"] = [namespace]
-
-        if _scute_init["scoreboard_needed"]:
-            _scute_init["commands"].append("scoreboard objectives add scute dummy")
-
-        create_function(pack.namespace, "scute_init", _scute_init["commands"])
-
-    for tag, functions in _tags.items():
-        namespace, name = tag.split(":")
-        create_json_file(
-            namespace, name, r"tags\functions", {"values": [func for func in functions]}
+import json
+import math
+
+from scute import pack
+from scute.internal.command import Command
+from scute.internal.utils import (
+    create_json_file,
+    format_text,
+    create_function,
+    function_path,
+)
+from scute.internal.optimize import instrument_functions
+from scute.internal.profiler import caller_source
+
+
+def _create_tag_file(namespace, name, kind, values, source=None):
+    profiler = pack._profiler
+    if profiler:
+        start = profiler.start()
+
+    data = {"values": values}
+    create_json_file(namespace, name, f"tags/{kind}", data)
+
+    if profiler:
+        profiler.record(
+            "tag",
+            f"{namespace}:{name}",
+            profiler.stop(start),
+            0,
+            len(json.dumps(data, indent=4).encode()),
+            source or caller_source(),
         )
-        print(format_text(f"Successfully created function tag {namespace}:{name}", 32))
-
-    print(format_text("Built!", 42, 30))
-
-
-atexit.register(_create_function_tag_files)
 
 
 def _add_func_to_tag(func, tag, decoratorName):
     try:
-        name = _function_namespaces[func.unwrapped]
-        if tag in _tags:
-            _tags[tag].append(name)
+        name = pack._function_namespaces[func.unwrapped]
+        if pack._profiler and tag not in pack._profiler.tag_sources:
+            pack._profiler.tag_sources[tag] = caller_source()
+        if tag in pack._tags:
+            pack._tags[tag].append(name)
         else:
-            _tags[tag] = [name]
+            pack._tags[tag] = [name]
     except KeyError:
         raise RuntimeError(f"@{decoratorName} decorators must be put above @func")
 
@@ -57,14 +56,129 @@ def load(func):
     return func
 
 
-def tick(func):
+def tick(func=None, *, every: int = 1, spread: bool = True):
     """
-    Adds your function to tick.json when used as a decorator
+    Adds your function to tick.json when used as a decorator. Used as `@tick(every=20)`, the function is only run
+    once every 20 ticks instead
+    Args:
+        every: How many ticks there are between each run
+        spread: Whether functions with the same period are spread across different ticks, so they don't all run on
+            the same one. Each function is put on the tick with the least commands scheduled so far
     """
-    _add_func_to_tag(func, "minecraft:tick", "tick")
+    if func is None:
+        return lambda function: tick(function, every=every, spread=spread)
+
+    if every == 1:
+        _add_func_to_tag(func, "minecraft:tick", "tick")
+    else:
+        try:
+            name = pack._function_namespaces[func.unwrapped]
+        except KeyError:
+            raise RuntimeError("@tick decorators must be put above @func")
+        if every < 1:
+            raise ValueError("Functions can't be run less than one tick apart")
+        pack._periodic.setdefault(every, []).append((name, spread))
     return func
 
 
+def _create_tick_dispatcher(tags: dict):
+    # Each period has a counter on the scute scoreboard going from 0 to period - 1, and each function runs when it's
+    # at the phase the function was given. The dispatcher is added to the tick tag in tags
+    from scute.scoreboards import _dispatch
+
+    # The load on every tick of a full cycle of all periods (capped, as it's only used to pick phases)
+    cycle = min(math.lcm(*pack._periodic), 7200)
+    load = [0] * cycle
+    phases = {}
+    functions = [
+        (period, name, spread)
+        for period, entries in pack._periodic.items()
+        for name, spread in entries
+    ]
+    # The most expensive functions are placed first, as the cheap ones are easier to fit in around them
+    functions.sort(key=lambda function: -_function_cost(function[1]))
+    for period, name, spread in functions:
+        cost = _function_cost(name)
+        phase = 0
+        if spread:
+            phase = min(
+                range(period),
+                key=lambda p: (max(load[p:cycle:period], default=0), p),
+            )
+        for t in range(phase, cycle, period):
+            load[t] += cost
+        phases.setdefault(period, {}).setdefault(phase, []).append(name)
+
+    commands = []
+    for period in sorted(phases):
+        # The scute objective is shared by every scute pack in the world, so each pack counts with its own holder
+        counter = f"${pack.namespace}_tick_{period}"
+        commands += [
+            Command("scoreboard", ["players", "add", counter, "scute", 1]),
+            Command(
+                "execute",
+                [
+                    "if",
+                    "score",
+                    counter,
+                    "scute",
+                    "matches",
+                    f"{period}..",
+                    "run",
+                    Command("scoreboard", ["players", "set", counter, "scute", 0]),
+                ],
+            ),
+        ]
+        cases = {
+            phase: [Command("function", [name]) for name in names]
+            for phase, names in phases[period].items()
+        }
+        commands.append(_dispatch(counter, "scute", cases))
+
+    create_function(pack.namespace, "scute_tick", commands)
+    tags.setdefault("minecraft:tick", []).append(pack.namespace + ":scute_tick")
+
+
+def _instrument():
+    from scute.instrumentation import CALLS_OBJECTIVE
+
+    dump = f"{pack.namespace}:scute_calls_dump"
+    reset = f"{pack.namespace}:scute_calls_reset"
+    locations = instrument_functions(pack._output, CALLS_OBJECTIVE, {dump, reset})
+
+    create_function(
+        pack.namespace,
+        "scute_calls_dump",
+        [
+            Command(
+                "tellraw",
+                [
+                    "@s",
+                    json.dumps(
+                        [
+                            {"text": location + ": "},
+                            {"score": {"name": location, "objective": CALLS_OBJECTIVE}},
+                        ]
+                    ),
+                ],
+            )
+            for location in locations
+        ],
+    )
+    create_function(
+        pack.namespace,
+        "scute_calls_reset",
+        [Command("scoreboard", ["players", "reset", "*", CALLS_OBJECTIVE])],
+    )
+    print(format_text(f"Instrumented {len(locations)} functions", 32))
+
+
+def _function_cost(name: str) -> int:
+    namespace, path = name.split(":")
+    file = pack._output.get(function_path(namespace, path))
+    return max(len(file.content), 1) if file else 1
+
+
 def functionTag(namespace, name):
     """
     Adds your function to a function tag of your choosing when used as a decorator
@@ -88,7 +202,7 @@ class BlockTag:
         """
         self.reference = f"{namespace}:{name}"
         if entries:
-            create_json_file(namespace, name, r"tags\blocks", {"values": entries})
+            _create_tag_file(namespace, name, "blocks", entries)
 
 
 class ItemTag:
@@ -102,4 +216,4 @@ class ItemTag:
         """
         self.reference = f"{namespace}:{name}"
         if entries:
-            create_json_file(namespace, name, r"tags\items", {"values": entries})
+            _create_tag_file(namespace, name, "items", entries)
@@ -0,0 +1,149 @@
+"""
+Rebuilds a pack every time its script, or a module next to it, is saved.
+
+    python -m scute watch mypack.py
+
+The pack stays loaded between builds. Functions are only run again when the module they're defined in changed, or a
+module whose functions or values they use, or a value or function they use is different - the rest are created from
+what they made last time, and only files whose contents changed are rewritten. Turn on `scute.Pack.set_deterministic_names`, so that anonymous functions that are run
+again keep their names when they haven't changed.
+"""
+import os
+import sys
+import time
+from os.path import abspath, dirname, getmtime
+from types import ModuleType
+
+from scute.function import _Recording, _global_names
+from scute.server import build_script
+from scute.internal.utils import format_text
+
+
+def _referenced_modules(function) -> set[str]:
+    # The modules of the functions, classes and modules a function uses, and its own
+    modules = {function.__module__}
+    values = [
+        function.__globals__.get(name) for name in _global_names(function.__code__)
+    ]
+    for cell in function.__closure__ or ():
+        try:
+            values.append(cell.cell_contents)
+        except ValueError:
+            pass
+    for value in values:
+        if isinstance(value, ModuleType):
+            modules.add(value.__name__)
+        else:
+            module = getattr(getattr(value, "unwrapped", value), "__module__", None)
+            if isinstance(module, str):
+                modules.add(module)
+    return modules
+
+
+class WatchCache:
+    def __init__(self):
+        """
+        Remembers what each function created, until a module it depends on changes
+        """
+        # {key: (recording, modules it depends on)}
+        self.entries: dict[tuple, tuple[_Recording, set[str]]] = {}
+
+    def _key(self, function, namespace: str, name: str | None) -> tuple | None:
+        import hashlib
+        from scute.internal.function_cache import _hash_function
+
+        # The same hash as the disk cache's, of everything besides modules a function depends on - like the locations
+        # of the functions it calls, which change when one of them can't be replayed, and the contents of lists it
+        # imported from other modules
+        digest = hashlib.sha256()
+        if not _hash_function(function, digest, set()):
+            return None
+        return (
+            function.__module__,
+            function.__qualname__,
+            function.__code__.co_firstlineno,
+            namespace,
+            name,
+            digest.hexdigest(),
+        )
+
+    def get(self, function, namespace: str, name: str | None) -> _Recording | None:
+        key = self._key(function, namespace, name)
+        entry = self.entries.get(key) if key is not None else None
+        return entry[0] if entry else None
+
+    def put(self, function, namespace: str, name: str | None, recording: _Recording):
+        key = self._key(function, namespace, name)
+        if key is not None:
+            self.entries[key] = (recording, _referenced_modules(function))
+
+    def invalidate(self, modules: set[str]):
+        """
+        Forgets every function that depends on one of the modules
+        """
+        self.entries = {
+            key: entry for key, entry in self.entries.items() if not entry[1] & modules
+        }
+
+
+def _watched_files(script: str) -> dict[str, tuple[str, float]]:
+    # The script and the modules imported from its folder, {path: (module name, modified time)}
+    folder = dirname(script) + os.sep
+    files = {script: "__main__"}
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if (
+            file
+            and abspath(file).startswith(folder)
+            and name != "scute"
+            and not name.startswith("scute.")
+            and "site-packages" not in file
+        ):
+            files[abspath(file)] = name
+
+    watched = {}
+    for path, name in files.items():
+        try:
+            watched[path] = (name, getmtime(path))
+        except OSError:
+            pass
+    return watched
+
+
+def _wait_for_changes(
+    watched: dict[str, tuple[str, float]], interval: float
+) -> set[str]:
+    # Polls the files until at least one changes, and returns the names of the modules that changed
+    while True:
+        time.sleep(interval)
+        changed = set()
+        for path, (name, mtime) in watched.items():
+            try:
+                if getmtime(path) != mtime:
+                    changed.add(name)
+            except OSError:
+                changed.add(name)
+        if changed:
+            return changed
+
+
+def watch(script: str, interval: float = 0.25):
+    """
+    Builds a pack, then rebuilds it every time its files change, until interrupted
+    Args:
+        script: The path of the pack's script
+        interval: How many seconds there are between checks for changes
+    """
+    script = abspath(script)
+    cache = WatchCache()
+    while True:
+        result = build_script(script, function_cache=cache)
+        sys.stdout.write(result["output"])
+        if result["ok"]:
+            print(format_text(f"Built in {result['time']}s, watching for changes", 32))
+        else:
+            print(format_text("Build failed, watching for changes", 31))
+
+        changed = _wait_for_changes(_watched_files(script), interval)
+        print(format_text(f"Changed: {', '.join(sorted(changed))}", 36))
+        cache.invalidate(changed)
@@ -0,0 +1,103 @@
+from scute import Pack
+from scute.commands import execute, else_, give
+from scute.function import func
+from scute.items import Item
+
+
+def _functions(tmp_path) -> list[str]:
+    return [
+        path.read_text()
+        for path in (tmp_path / "p" / "data" / "ns" / "functions").glob("*.mcfunction")
+    ]
+
+
+def test_forking_condition_uses_scoreboard(tmp_path):
+    with Pack("p", str(tmp_path), "ns", version="1.20.4") as pack:
+        pack.set_branch_mode("return")
+
+        @func("ns", "main")
+        def main():
+            execute().as_("@a").if_.entity("@s[tag=a]").run(give("@s", Item.diamond))
+            else_(give("@s", Item.stone))
+
+    functions = _functions(tmp_path)
+    assert not any("return" in body for body in functions)
+    assert any("unless score $success scute matches 1" in body for body in functions)
+
+
+def test_forking_branch_in_chain_returns_after_it(tmp_path):
+    with Pack("p", str(tmp_path), "ns", version="1.20.4") as pack:
+        pack.set_branch_mode("return")
+
+        @func("ns", "main")
+        def main():
+            execute().if_.entity("@s[tag=a]").run(give("@s", Item.diamond))
+            else_(execute().at("@e").if_.entity("@s[tag=b]").run(give("@s", Item.dirt)))
+            else_(give("@s", Item.stone))
+
+    (chain,) = [body for body in _functions(tmp_path) if "give @s stone" in body]
+    assert chain.splitlines()[-2:] == [
+        "execute if score $success scute matches 1 run return 0",
+        "give @s stone",
+    ]
+    assert "at @e if entity @s[tag=b] run return" not in chain
+
+
+def test_named_function_is_wrapped_not_patched(tmp_path):
+    with Pack("p", str(tmp_path), "ns", version="1.20.4"):
+
+        @func("ns", "reward")
+        def reward():
+            give("@s", Item.diamond)
+
+        @func("ns", "main")
+        def main():
+            execute().if_.entity("@s[tag=a]").run(reward)
+            else_(give("@s", Item.stone))
+
+    functions = tmp_path / "p" / "data" / "ns" / "functions"
+    assert (functions / "reward.mcfunction").read_text() == "give @s diamond\n"
+    main = (functions / "main.mcfunction").read_text()
+    assert "run function ns:reward" not in main
+
+
+def test_branch_in_command_list(tmp_path):
+    with Pack("p", str(tmp_path), "ns", version="1.20.4") as pack:
+        pack.set_branch_mode("return")
+
+        @func("ns", "main")
+        def main():
+            execute().as_("@a").run(
+                [
+                    execute().if_.entity("@s[tag=b]").run(give("@s", Item.diamond)),
+                    else_(give("@s", Item.dirt)),
+                    give("@s", Item.apple),
+                ]
+            )
+
+    (body,) = [body for body in _functions(tmp_path) if "give @s apple" in body]
+    lines = body.splitlines()
+    assert len(lines) == 2
+    assert lines[0].startswith("function ns:")
+    assert lines[1] == "give @s apple"
+
+
+def test_scoreboard_branch_in_command_list(tmp_path):
+    with Pack("p", str(tmp_path), "ns", version="1.20.4"):
+
+        @func("ns", "main")
+        def main():
+            execute().as_("@a").run(
+                [
+                    execute().if_.entity("@s[tag=b]").run(give("@s", Item.diamond)),
+                    else_(give("@s", Item.dirt)),
+                    give("@s", Item.apple),
+                ]
+            )
+
+    (body,) = [body for body in _functions(tmp_path) if "give @s apple" in body]
+    assert body.splitlines()[1:] == [
+        "execute unless score $success scute matches 1 run give @s dirt",
+        "scoreboard players set $success scute 0",
+        "give @s apple",
+    ]
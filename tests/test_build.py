@@ -0,0 +1,31 @@
+from scute import Pack
+from scute.commands import give
+from scute.function import func
+from scute.items import Item
+from scute.tags import tick
+
+
+def _build(path) -> dict[str, str]:
+    with Pack("p", str(path), "ns", version="1.20"):
+        for i in range(6):
+
+            @tick(every=4)
+            @func("ns", f"periodic_{i}")
+            def periodic():
+                give("@s", Item.diamond)
+
+    functions = path / "p" / "data" / "ns" / "functions"
+    return {file.name: file.read_text() for file in functions.glob("*.mcfunction")}
+
+
+def test_build_functions_have_stable_names(tmp_path):
+    first = _build(tmp_path / "first")
+    # Switches over the tick counter get functions of their own
+    assert len(first) > 8
+    assert _build(tmp_path / "second") == first
+
+
+def test_tick_counters_belong_to_the_pack(tmp_path):
+    # Other packs in the world count on the same scute objective
+    first_line = _build(tmp_path)["scute_tick.mcfunction"].splitlines()[0]
+    assert first_line == "scoreboard players add $ns_tick_4 scute 1"
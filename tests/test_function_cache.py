@@ -0,0 +1,33 @@
+from scute.internal.function_cache import DiskCache
+
+COLORS = ["red", "blue"]
+
+
+class _Settings:
+    pass
+
+
+SETTINGS = _Settings()
+
+
+def uses_list():
+    return COLORS
+
+
+def uses_object():
+    return SETTINGS
+
+
+def test_key_changes_with_list_contents(tmp_path):
+    cache = DiskCache(str(tmp_path), 1024)
+    before = cache._key(uses_list, "ns", "main")
+    COLORS.append("green")
+    try:
+        assert cache._key(uses_list, "ns", "main") not in (None, before)
+    finally:
+        COLORS.pop()
+    assert cache._key(uses_list, "ns", "main") == before
+
+
+def test_unknown_globals_are_not_cached(tmp_path):
+    assert DiskCache(str(tmp_path), 1024)._key(uses_object, "ns", "main") is None
@@ -0,0 +1,17 @@
+from scute.blocks import Block
+from scute.items import Item
+
+
+def test_identical_nbt_shares_encoded_text():
+    first = Item(Item.diamond, {"CustomModelData": 3})
+    second = Item(Item.diamond, {"CustomModelData": 3})
+    assert first.commandFormat == "minecraft:diamond{CustomModelData: 3}"
+    assert first._snbt is second._snbt
+
+
+def test_assigning_nbt_encodes_it_again():
+    block = Block(Block.chest, {"Lock": "key"})
+    block.nbt = {"Lock": "other"}
+    assert block.commandFormat == "chest{Lock: 'other'}"
+    block.nbt = None
+    assert block.commandFormat == "chest"
@@ -0,0 +1,20 @@
+from scute.internal.command import Command
+from scute.internal.optimize import peephole_optimize
+
+
+def _score(action: str, value: int) -> Command:
+    return Command("scoreboard", ["players", action, "$x", "obj", value])
+
+
+def test_folded_writes_wrap_around():
+    (command,) = peephole_optimize([_score("set", 2147483647), _score("add", 1)])
+    assert str(command) == "scoreboard players set $x obj -2147483648"
+    (command,) = peephole_optimize([_score("set", -2147483648), _score("remove", 2)])
+    assert str(command) == "scoreboard players set $x obj 2147483646"
+
+
+def test_folded_writes():
+    commands = [_score("set", 0), _score("add", 5), _score("remove", 2)]
+    assert [str(command) for command in peephole_optimize(commands)] == [
+        "scoreboard players set $x obj 3"
+    ]
@@ -0,0 +1,86 @@
+import re
+
+import pytest
+
+from scute import Pack
+from scute.commands import execute, else_, give
+from scute.function import func
+from scute.items import Item
+
+
+def _build(tmp_path, **settings) -> dict[str, str]:
+    # Builds a pack with two functions whose branches are identical, and returns the text of its functions
+    with Pack("p", str(tmp_path), "ns", version="1.20") as pack:
+        pack.set_branch_mode("return")
+        for setting, value in settings.items():
+            getattr(pack, f"set_{setting}")(value)
+
+        for name in ("a", "b"):
+
+            @func("ns", name)
+            def branches():
+                execute().if_.entity("@s[tag=x]").run(
+                    [give("@s", Item.diamond), give("@s", Item.dirt)]
+                )
+                else_([give("@s", Item.stone), give("@s", Item.apple)])
+
+    functions = {}
+    for path in (tmp_path / "p" / "data").glob("*/functions/**/*.mcfunction"):
+        namespace, _, *name = path.relative_to(tmp_path / "p" / "data").parts
+        location = f"{namespace}:{'/'.join(name).removesuffix('.mcfunction')}"
+        functions[location] = path.read_text()
+    return functions
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {},
+        {"deduplicate": True},
+        {"minify": True},
+        {"deduplicate": True, "minify": True},
+    ],
+)
+def test_return_run_references_resolve(tmp_path, settings):
+    functions = _build(tmp_path, **settings)
+    references = set()
+    for body in functions.values():
+        references.update(re.findall(r"\bfunction (\w+:[\w/.-]+)", body))
+    assert any("return run function" in body for body in functions.values())
+    assert references
+    assert references <= set(functions)
+
+
+def test_unrenamed_reference_fails_minify(tmp_path):
+    from scute.commands import run_raw
+
+    with pytest.raises(RuntimeError, match="can't be minified"):
+        with Pack("p", str(tmp_path), "ns", version="1.20") as pack:
+            pack.set_minify()
+
+            @func()
+            def anonymous():
+                give("@s", Item.diamond)
+
+            @func("ns", "main")
+            def main():
+                location = pack._function_namespaces[anonymous.unwrapped]
+                run_raw(f"function {location} {{x: 1}}")
+
+
+def test_scheduled_functions_are_not_deduplicated(tmp_path):
+    from scute.commands import schedule
+
+    with Pack("p", str(tmp_path), "ns", version="1.20") as pack:
+        pack.set_deduplicate()
+
+        @func("ns", "main")
+        def main():
+            schedule([give("@s", Item.diamond), give("@s", Item.dirt)], 10)
+            schedule([give("@s", Item.diamond), give("@s", Item.dirt)], 20)
+
+    main = (
+        tmp_path / "p" / "data" / "ns" / "functions" / "main.mcfunction"
+    ).read_text()
+    first, second = [line.split()[2] for line in main.splitlines()]
+    assert first != second
@@ -0,0 +1,42 @@
+from scute.server import build_script
+
+SCRIPT = """
+from scute import Pack
+from scute.commands import give
+from scute.function import func
+from scute.items import Item
+
+with Pack("pa", "out", "ns", version="1.20"):
+
+    @func("ns", "main")
+    def main():
+        give("@s", Item.diamond)
+"""
+
+
+def test_packs_created_by_script_use_build_folder(tmp_path, monkeypatch):
+    client, server = tmp_path / "client", tmp_path / "server"
+    client.mkdir()
+    server.mkdir()
+    (client / "pack.py").write_text(SCRIPT)
+    monkeypatch.chdir(server)
+
+    result = build_script("pack.py", str(client))
+
+    assert result["ok"], result["output"]
+    assert (client / "out" / "pa" / "pack.mcmeta").exists()
+    assert not (server / "out").exists()
+
+
+def test_packs_created_by_script_use_function_cache(tmp_path, capsys):
+    from scute.watch import WatchCache
+
+    (tmp_path / "pack.py").write_text(SCRIPT)
+    cache = WatchCache()
+    build_script("pack.py", str(tmp_path), cache)
+    capsys.readouterr()
+    result = build_script("pack.py", str(tmp_path), cache)
+
+    assert result["ok"], result["output"]
+    # Without the server's output capture, builds print to stdout
+    assert "Reused function ns:main" in capsys.readouterr().out
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from scute import Pack
+from scute.commands import execute, run_raw
+from scute.function import func
+from scute.scoreboards import Scoreboard, Criteria
+
+
+def _matches(text: str, score: int) -> bool:
+    low, dots, high = text.partition("..")
+    if not dots:
+        return score == int(low)
+    return (not low or score >= int(low)) and (not high or score <= int(high))
+
+
+def _run(functions: dict[str, list[str]], name: str, score: int, ran: list):
+    # Runs a function for a score, following the few commands switches are made of. Returns whether it returned
+    def line(text: str) -> bool:
+        words = text.split(" ")
+        if words[:2] == ["execute", "if"]:
+            rest = text.split(" run ", 1)[1]
+            return _matches(words[6], score) and line(rest)
+        if words[:2] == ["execute", "as"]:
+            return line(text.split(" run ", 1)[1])
+        if words[:2] == ["return", "run"]:
+            line(text[len("return run ") :])
+            return True
+        if words[0] == "function":
+            _run(functions, words[1], score, ran)
+        else:
+            ran.append(text)
+        return False
+
+    for text in functions[name]:
+        if line(text):
+            return
+
+
+@pytest.mark.parametrize("mode", ["scoreboard", "return"])
+@pytest.mark.parametrize("seed", range(20))
+def test_switch_runs_the_matching_case(tmp_path, mode, seed):
+    rng = random.Random(seed)
+    values = sorted(rng.sample(range(-5, 25), rng.randint(1, 9)))
+    forking = {value for value in values if rng.random() < 0.3}
+    default = rng.random() < 0.5
+
+    with Pack("p", str(tmp_path), "ns", version="1.20.4") as pack:
+        pack.set_branch_mode(mode)
+        board = Scoreboard("obj", Criteria.dummy)
+
+        @func("ns", "main")
+        def main():
+            cases = {}
+            for value in values:
+                say = run_raw(f"say {value}")
+                cases[value] = execute().as_("@a").run(say) if value in forking else say
+            board.switch("@s", cases, run_raw("say default") if default else None)
+
+    functions = {}
+    for path in (tmp_path / "p" / "data" / "ns" / "functions").glob("*.mcfunction"):
+        functions[f"ns:{path.stem}"] = path.read_text().splitlines()
+
+    for score in range(-10, 30):
+        ran = []
+        _run(functions, "ns:main", score, ran)
+        if score in values:
+            assert ran == [f"say {score}"], score
+        else:
+            assert ran == (["say default"] if default else []), score
+    for body in functions.values():
+        for text in body:
+            # Returning while running for several entities would skip the rest of them
+            assert " as " not in text.partition("return run")[2]
+            assert text.count("if score") <= 1